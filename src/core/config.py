@@ -3,39 +3,68 @@ Configuration management for the application.
 """
 
 import os
+import re
 import json
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, List, Dict
 from dotenv import load_dotenv
 import logging
 import sys
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib parser
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Immutable application paths, computed once at import time
+_APP_NAME = "MathsByPawanSir"
+if os.name == 'nt':  # Windows
+    _APP_DATA_DIR = Path(os.getenv('APPDATA')) / _APP_NAME
+else:  # Linux/Mac
+    _APP_DATA_DIR = Path.home() / f'.{_APP_NAME.lower()}'
+
+
 class Config:
     """Application configuration manager."""
     
     # Default class and chapter configuration
     DEFAULT_CHAPTERS = {}
-    
+
+    # Process-wide singleton; configuration is parsed exactly once
+    _instance: Optional["Config"] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    @classmethod
+    def instance(cls) -> "Config":
+        """Return the shared configuration instance."""
+        return cls()
+
     def __init__(self):
-        """Initialize configuration."""
+        """Initialize configuration (once; later calls reuse the singleton)."""
+        if getattr(self, '_initialized', False):
+            return
         # Load environment variables
         self._load_env()
         
         # Application settings
-        self.app_name = "MathsByPawanSir"
+        self.app_name = _APP_NAME
         self.app_version = "1.0.0"
-        
+
         # Paths
         self.base_dir = Path(__file__).parent.parent.parent
-        
-        # Use AppData directory for Windows
-        if os.name == 'nt':  # Windows
-            self.app_data_dir = Path(os.getenv('APPDATA')) / self.app_name
-        else:  # Linux/Mac
-            self.app_data_dir = Path.home() / f'.{self.app_name.lower()}'
-            
+        self.app_data_dir = _APP_DATA_DIR
+
+
         self.data_dir = Path(os.getenv("RECORDING_PATH", str(self.app_data_dir / "data")))
         self.config_file = self.app_data_dir / "chapters.json"
         self.ensure_directories()
@@ -47,10 +76,41 @@ class Config:
         # Upload settings
         self.max_upload_size = int(os.getenv("MAX_UPLOAD_SIZE", "100")) * 1024 * 1024  # Convert MB to bytes
         self.allowed_file_types = os.getenv("ALLOWED_FILE_TYPES", "*").split(",")
+        # Compile the extension filter once; a single alternation regex
+        # scales better than one endswith check per allowed type
+        if self.allowed_file_types != ["*"]:
+            self._ext_pattern = re.compile(
+                r'\.(?:' + '|'.join(
+                    re.escape(ext.strip().lstrip('.')) for ext in self.allowed_file_types
+                ) + r')$',
+                re.IGNORECASE
+            )
+        else:
+            self._ext_pattern = None
         
-        # Load or create chapters configuration
-        self.chapters = self._load_chapters()
-    
+        # Parse the chapters configuration on a background thread so
+        # construction doesn't block the UI; the chapters property joins
+        # the future on first access.
+        self._chapters: Optional[Dict[str, Dict[str, List[str]]]] = None
+        # Parsed-file cache keyed on (mtime_ns, size, inode); reloads of an
+        # unchanged chapters.json skip the parse entirely. The lock guards
+        # against concurrent loads from the UI thread and workers.
+        self._load_lock = threading.Lock()
+        self._load_cache: Optional[dict] = None
+        self._load_cache_key: Optional[tuple] = None
+        self._chapters_future = ThreadPoolExecutor(max_workers=1).submit(self._load_chapters)
+
+        # Deferred-save state for batched mutations
+        self._dirty = False
+        self._batch_depth = 0
+        self._last_saved_hash: Optional[int] = None
+        atexit.register(self._flush)
+
+        # Memoized getter results, invalidated on mutation
+        self._read_cache: Dict[tuple, List[str]] = {}
+
+        self._initialized = True
+
     def _load_env(self):
         """Load environment variables from the correct location."""
         if getattr(sys, 'frozen', False):
@@ -74,36 +134,122 @@ class Config:
         self.data_dir.mkdir(exist_ok=True)
         self.config_file.parent.mkdir(exist_ok=True)
     
+    @property
+    def chapters(self) -> Dict[str, Dict[str, List[str]]]:
+        """Chapters configuration, loaded in the background at construction."""
+        if self._chapters is None:
+            self._chapters = self._chapters_future.result()
+        return self._chapters
+
     def _load_chapters(self) -> dict:
         """Load chapters from JSON file or create new if not exists."""
-        if self.config_file.exists():
-            try:
-                with self.config_file.open("r") as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading chapters: {e}")
-        
-        # Return empty dict if file doesn't exist or there's an error
-        return {}
+        # Read through a raw fd: one open, one fstat (doubling as the cache
+        # key below), one read — rather than the open().read() syscall chain.
+        try:
+            fd = os.open(self.config_file, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+        except OSError:
+            # Return empty dict if file doesn't exist
+            return {}
+
+        try:
+            stat = os.fstat(fd)
+            # A matching (mtime, size, inode) key means the file is
+            # byte-identical to the last parse; both in-place edits and
+            # atomic os.replace writes change the key, so a hit is always
+            # safe to reuse.
+            key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            with self._load_lock:
+                if key == self._load_cache_key and self._load_cache is not None:
+                    return self._load_cache
+                try:
+                    data = os.read(fd, stat.st_size + 1)
+                    if orjson is not None:
+                        parsed = orjson.loads(data)
+                    else:
+                        parsed = json.loads(data)
+                except Exception as e:
+                    print(f"Error loading chapters: {e}")
+                    return {}
+                self._load_cache = parsed
+                self._load_cache_key = key
+                return parsed
+        finally:
+            os.close(fd)
+
+    def reload(self) -> None:
+        """Re-read the chapters configuration from disk.
+
+        Cheap when the file hasn't changed: the stat-keyed cache in
+        _load_chapters skips the parse.
+        """
+        self._chapters = self._load_chapters()
+        self._read_cache.clear()
     
     def _save_chapters(self, chapters: Dict[str, Dict[str, List[str]]]) -> None:
         """Save chapters to config file."""
         try:
+            if orjson is not None:
+                data = orjson.dumps(chapters, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(chapters, indent=4, ensure_ascii=False).encode('utf-8')
+
+            # Skip the disk write when the serialized content hasn't changed
+            content_hash = hash(data)
+            if content_hash == self._last_saved_hash:
+                logger.debug("Chapters configuration unchanged, skipping save")
+                return
+
             logger.info(f"Saving chapters configuration to: {self.config_file}")
-            with self.config_file.open('w', encoding='utf-8') as f:
-                json.dump(chapters, f, indent=4, ensure_ascii=False)
+            # Write to a temp file and atomically swap it in so a crash
+            # mid-write can't leave a truncated chapters.json behind
+            tmp_file = self.config_file.with_suffix('.json.tmp')
+            with tmp_file.open('wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+            self._last_saved_hash = content_hash
             logger.info("Successfully saved chapters configuration")
         except Exception as e:
             logger.error(f"Error saving chapters: {e}")
     
+    def _mark_dirty(self) -> None:
+        """Record a pending mutation, saving immediately unless inside a batch."""
+        self._dirty = True
+        self._read_cache.clear()
+        if self._batch_depth == 0:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write the chapters configuration to disk if there are unsaved changes."""
+        if self._dirty:
+            self._save_chapters(self.chapters)
+            self._dirty = False
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer chapter saves until the end of the block.
+
+        Mutations made inside the block (add_class, add_chapter, add_subtopic)
+        are written to disk once on exit instead of once per call.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush()
+
     def add_class(self, class_name: str) -> bool:
         """Add a new class."""
         if class_name in self.chapters:
             return False
         self.chapters[class_name] = {}  # Initialize with empty dict for chapters
-        self._save_chapters(self.chapters)
+        self._mark_dirty()
         return True
-    
+
     def add_chapter(self, class_name: str, chapter_name: str) -> bool:
         """Add a new chapter to a class."""
         if class_name not in self.chapters:
@@ -111,9 +257,9 @@ class Config:
         if chapter_name in self.chapters[class_name]:
             return False
         self.chapters[class_name][chapter_name] = ["Main"]  # Initialize with "Main" subtopic
-        self._save_chapters(self.chapters)
+        self._mark_dirty()
         return True
-    
+
     def add_subtopic(self, class_name: str, chapter_name: str, subtopic_name: str) -> bool:
         """Add a new subtopic to a chapter."""
         if class_name not in self.chapters or chapter_name not in self.chapters[class_name]:
@@ -121,7 +267,7 @@ class Config:
         if subtopic_name in self.chapters[class_name][chapter_name]:
             return False
         self.chapters[class_name][chapter_name].append(subtopic_name)
-        self._save_chapters(self.chapters)
+        self._mark_dirty()
         return True
     
     @property
@@ -143,16 +289,19 @@ class Config:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if not file_path.exists():
+        try:
+            file_size = os.stat(file_path).st_size
+        except OSError:
+            # Covers missing files but also permission errors, unreadable
+            # mounts and bad path components - validation reports them
+            # instead of letting the stat crash the caller
             return False, "File does not exist"
-        
-        if file_path.stat().st_size > self.max_upload_size:
+
+        if file_size > self.max_upload_size:
             return False, f"File size exceeds maximum allowed size of {self.max_upload_size // (1024 * 1024)}MB"
-        
-        if self.allowed_file_types != ["*"]:
-            file_ext = file_path.suffix.lower()
-            if not any(file_ext.endswith(ext.strip()) for ext in self.allowed_file_types):
-                return False, f"File type not allowed. Allowed types: {', '.join(self.allowed_file_types)}"
+
+        if self._ext_pattern is not None and not self._ext_pattern.search(file_path.name):
+            return False, f"File type not allowed. Allowed types: {', '.join(self.allowed_file_types)}"
         
         return True, None
     
@@ -163,7 +312,11 @@ class Config:
         Returns:
             List of class names
         """
-        return list(self.chapters.keys())
+        key = ('classes',)
+        cached = self._read_cache.get(key)
+        if cached is None:
+            cached = self._read_cache[key] = list(self.chapters.keys())
+        return cached
     
     def get_chapters(self, class_name: str) -> List[str]:
         """
@@ -175,7 +328,11 @@ class Config:
         Returns:
             List of chapter names
         """
-        return list(self.chapters.get(class_name, {}).keys())
+        key = ('chapters', class_name)
+        cached = self._read_cache.get(key)
+        if cached is None:
+            cached = self._read_cache[key] = list(self.chapters.get(class_name, {}).keys())
+        return cached
     
     def get_subtopics(self, class_name: str, chapter_name: str) -> List[str]:
         """
@@ -188,4 +345,8 @@ class Config:
         Returns:
             List of subtopic names
         """
-        return self.chapters.get(class_name, {}).get(chapter_name, ["Main"]) 
\ No newline at end of file
+        key = ('subtopics', class_name, chapter_name)
+        cached = self._read_cache.get(key)
+        if cached is None:
+            cached = self._read_cache[key] = self.chapters.get(class_name, {}).get(chapter_name, ["Main"])
+        return cached 
\ No newline at end of file
@@ -1,19 +1,35 @@
+import httplib2
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
 import os
+import json
 import logging
 import sys
+import threading
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Credentials are cached per process: loading the service-account file
+# involves an RSA key import, which is too expensive to repeat on every
+# manager construction (e.g. reconnects).
+_CREDS_CACHE = None
+_CREDS_LOCK = threading.Lock()
+
+
 class GoogleDriveManager:
     SCOPES = ['https://www.googleapis.com/auth/drive.file']
     SERVICE_ACCOUNT_FILE = 'service-account.json'
     DRIVE_VIEW_URL = "https://drive.google.com/file/d/{}/view"
+    UPLOAD_CHUNK_SIZE = int(os.getenv('UPLOAD_CHUNK_SIZE', str(16 * 1024 * 1024)))
+    FILENAME_TEMPLATE = "{class_name}_{chapter_name}_{subtopic_name}_{date}_Class_{number}{ext}"
     
     def __init__(self):
         # Load environment variables
@@ -25,7 +41,25 @@ class GoogleDriveManager:
             raise ValueError("GOOGLE_DRIVE_FOLDER_ID not found in environment variables. Please check your .env file.")
             
         self.creds = self._get_credentials()
-        self.service = build('drive', 'v3', credentials=self.creds, cache_discovery=False)
+        # httplib2.Http is not thread-safe, so requests don't share one
+        # transport: each thread gets its own keep-alive connection via
+        # _thread_http. This instance only backs service construction.
+        self._http = AuthorizedHttp(self.creds, http=httplib2.Http())
+        self.service = build('drive', 'v3', http=self._http, cache_discovery=False)
+        self._thread_local = threading.local()
+
+        # Cache of (parent_id, folder_name) -> folder_id to avoid repeat
+        # lookups; persisted to disk so it survives app restarts
+        self._folder_cache_file = self._get_app_data_dir() / "drive_folders.json"
+        self._folder_cache = self._load_folder_cache()
+
+        # Worker pool for running independent Drive requests concurrently
+        self._executor = ThreadPoolExecutor(max_workers=4)
+
+        # Dedicated pool for full uploads so long transfers never block callers
+        self._upload_pool = ThreadPoolExecutor(
+            max_workers=int(os.getenv('UPLOAD_CONCURRENCY', '2'))
+        )
 
     def _load_env(self):
         """Load environment variables from the correct location."""
@@ -45,7 +79,9 @@ class GoogleDriveManager:
         
         load_dotenv(env_path)
 
-    def _get_service_account_path(self):
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_service_account_path():
         """Get the correct path for the service account file."""
         if getattr(sys, 'frozen', False):
             # If we're running in a PyInstaller bundle
@@ -53,50 +89,146 @@ class GoogleDriveManager:
         else:
             # If we're running in development
             base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        
-        return os.path.join(base_path, self.SERVICE_ACCOUNT_FILE)
+
+        return os.path.join(base_path, GoogleDriveManager.SERVICE_ACCOUNT_FILE)
 
     def _get_credentials(self):
+        global _CREDS_CACHE
         try:
-            service_account_path = self._get_service_account_path()
-            logger.info(f"Loading service account from: {service_account_path}")
-            return service_account.Credentials.from_service_account_file(
-                service_account_path,
-                scopes=self.SCOPES
-            )
+            with _CREDS_LOCK:
+                if _CREDS_CACHE is None:
+                    service_account_path = self._get_service_account_path()
+                    logger.info(f"Loading service account from: {service_account_path}")
+                    _CREDS_CACHE = service_account.Credentials.from_service_account_file(
+                        service_account_path,
+                        scopes=self.SCOPES
+                    )
+                return _CREDS_CACHE
         except Exception as e:
             logger.error(f"Error loading credentials: {str(e)}")
             raise
 
+    @staticmethod
+    def _get_app_data_dir() -> Path:
+        """Get the per-user application data directory."""
+        app_name = "MathsByPawanSir"
+        if os.name == 'nt':  # Windows
+            return Path(os.getenv('APPDATA')) / app_name
+        return Path.home() / f'.{app_name.lower()}'
+
+    def _load_folder_cache(self) -> dict:
+        """Load the persisted folder-ID cache, if any."""
+        try:
+            if self._folder_cache_file.exists():
+                with self._folder_cache_file.open('r', encoding='utf-8') as f:
+                    return {tuple(key.split('/', 1)): folder_id
+                            for key, folder_id in json.load(f).items()}
+        except Exception as e:
+            logger.warning(f"Could not load folder cache: {e}")
+        return {}
+
+    def _save_folder_cache(self) -> None:
+        """Persist the folder-ID cache so restarts skip re-resolution."""
+        try:
+            self._folder_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            serializable = {f"{parent_id}/{name}": folder_id
+                            for (parent_id, name), folder_id in self._folder_cache.items()}
+            with self._folder_cache_file.open('w', encoding='utf-8') as f:
+                json.dump(serializable, f, indent=4)
+        except Exception as e:
+            logger.warning(f"Could not save folder cache: {e}")
+
+    def _thread_http(self) -> AuthorizedHttp:
+        """Authorized transport owned by the calling thread.
+
+        The executor workers, the upload pool and Qt-side upload workers
+        all issue requests concurrently; one shared httplib2.Http would
+        interleave them on a single socket. Each thread builds its own
+        keep-alive connection once and reuses it, so the TLS handshake is
+        still paid once per thread rather than per request.
+        """
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = AuthorizedHttp(self.creds, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+
+    @staticmethod
+    def _escape_query_value(value: str) -> str:
+        """Escape a value for use inside a single-quoted Drive query string."""
+        return value.replace("\\", "\\\\").replace("'", "\\'")
+
+    @staticmethod
+    def _is_not_found(exc) -> bool:
+        """Whether an API error means the referenced file/folder is gone."""
+        status = getattr(exc, 'status_code', None) \
+            or getattr(getattr(exc, 'resp', None), 'status', None)
+        return status == 404
+
+    def _evict_stale_folder(self, folder_id: str) -> None:
+        """Drop cache entries referencing a folder Drive says is gone.
+
+        Removes the entry that resolved to the stale id and anything
+        cached beneath it, then re-persists so restarts stay clean too.
+        """
+        stale = [key for key, cached_id in self._folder_cache.items()
+                 if cached_id == folder_id or key[0] == folder_id]
+        if stale:
+            logger.warning(f"Evicting {len(stale)} stale folder cache entries for {folder_id}")
+            for key in stale:
+                del self._folder_cache[key]
+            self._save_folder_cache()
+
     def get_or_create_folder(self, folder_name, parent_id=None):
         """Get or create a folder in Google Drive."""
         parent_id = parent_id or self.shared_folder_id
-        try:
-            query = f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder' and '{parent_id}' in parents and trashed=false"
-            results = self.service.files().list(
-                q=query,
-                spaces='drive',
+        cache_key = (parent_id, folder_name)
+        cached_id = self._folder_cache.get(cache_key)
+        if cached_id:
+            return cached_id
+        # A not-found answer means a cached id went stale (the folder was
+        # trashed or deleted in Drive); evict it and retry once so the
+        # cache heals itself instead of poisoning every later upload
+        for retry in (False, True):
+            try:
+                return self._lookup_or_create_folder(folder_name, parent_id, cache_key)
+            except Exception as e:
+                if not retry and self._is_not_found(e):
+                    self._evict_stale_folder(parent_id)
+                    self._folder_cache.pop(cache_key, None)
+                    continue
+                logger.error(f"Error with folder operation: {str(e)}")
+                raise
+
+    def _lookup_or_create_folder(self, folder_name, parent_id, cache_key):
+        """Resolve a folder id against Drive and cache the result."""
+        query = f"name='{self._escape_query_value(folder_name)}' and mimeType='application/vnd.google-apps.folder' and '{parent_id}' in parents and trashed=false"
+        results = self.service.files().list(
+            q=query,
+            spaces='drive',
+            fields='files(id)',
+            pageSize=1,
+            supportsAllDrives=True
+        ).execute(http=self._thread_http())
+        items = results.get('files', [])
+
+        if items:
+            folder_id = items[0]['id']
+        else:
+            file_metadata = {
+                'name': folder_name,
+                'mimeType': 'application/vnd.google-apps.folder',
+                'parents': [parent_id]
+            }
+            file = self.service.files().create(
+                body=file_metadata,
+                fields='id',
                 supportsAllDrives=True
-            ).execute()
-            items = results.get('files', [])
-
-            if items:
-                return items[0]['id']
-            else:
-                file_metadata = {
-                    'name': folder_name,
-                    'mimeType': 'application/vnd.google-apps.folder',
-                    'parents': [parent_id]
-                }
-                file = self.service.files().create(
-                    body=file_metadata,
-                    fields='id',
-                    supportsAllDrives=True
-                ).execute()
-                return file.get('id')
-        except Exception as e:
-            logger.error(f"Error with folder operation: {str(e)}")
-            raise
+            ).execute(http=self._thread_http())
+            folder_id = file.get('id')
+        self._folder_cache[cache_key] = folder_id
+        self._save_folder_cache()
+        return folder_id
 
     def get_or_create_class_year_folder(self, class_name: str, year: str) -> str:
         """Get or create the class-year folder."""
@@ -110,37 +242,47 @@ class GoogleDriveManager:
     def count_files_in_folder(self, folder_id: str, file_extension: str = None) -> int:
         """Count the number of files in a folder and all its subfolders, optionally filtered by extension."""
         try:
+            # Iterative breadth-first walk: one paged listing per folder
+            # classifies files and subfolders in the same response, and
+            # pageToken handling keeps the count correct past 1000 entries.
+            queue = deque([folder_id])
             total_count = 0
-            
-            # First count files in the current folder
-            query = f"'{folder_id}' in parents and trashed=false"
-            if file_extension:
-                query += f" and name contains '.{file_extension}'"
-            results = self.service.files().list(
-                q=query,
-                spaces='drive',
-                supportsAllDrives=True
-            ).execute()
-            total_count += len(results.get('files', []))
-
-            # Then get all subfolders and count files in them recursively
-            folder_query = f"'{folder_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
-            folder_results = self.service.files().list(
-                q=folder_query,
-                spaces='drive',
-                supportsAllDrives=True
-            ).execute()
-            
-            for subfolder in folder_results.get('files', []):
-                total_count += self.count_files_in_folder(subfolder['id'], file_extension)
+            suffix = f".{file_extension}" if file_extension else None
+            http = self._thread_http()
+
+            while queue:
+                current_id = queue.popleft()
+                page_token = None
+                while True:
+                    results = self.service.files().list(
+                        q=f"'{current_id}' in parents and trashed=false",
+                        spaces='drive',
+                        fields='nextPageToken,files(id,name,mimeType)',
+                        pageSize=1000,
+                        pageToken=page_token,
+                        supportsAllDrives=True
+                    ).execute(http=http)
+                    for item in results.get('files', []):
+                        if item.get('mimeType') == 'application/vnd.google-apps.folder':
+                            queue.append(item['id'])
+                        elif suffix is None or item.get('name', '').endswith(suffix):
+                            total_count += 1
+                    page_token = results.get('nextPageToken')
+                    if not page_token:
+                        break
 
             return total_count
         except Exception as e:
             logger.error(f"Error counting files in folder: {str(e)}")
             return 0
 
-    def upload_file(self, filepath, class_name: str, chapter_name: str, year: str, subtopic_name: str = "Main", progress_callback=None):
-        """Upload a file to Google Drive with progress tracking."""
+    def upload_file(self, filepath, class_name: str, chapter_name: str, year: str, subtopic_name: str = "Main", progress_callback=None, date_str: str = None):
+        """
+        Upload a file to Google Drive with progress tracking.
+
+        Batch callers can pass a precomputed date_str to avoid reformatting
+        the date once per file.
+        """
         try:
             if not os.path.exists(filepath):
                 raise FileNotFoundError(f"File not found: {filepath}")
@@ -151,29 +293,44 @@ class GoogleDriveManager:
             # Get or create the chapter folder
             chapter_folder_id = self.get_or_create_chapter_folder(chapter_name, class_year_folder_id)
             
-            # Get or create the subtopic folder
-            subtopic_folder_id = self.get_or_create_folder(subtopic_name, chapter_folder_id)
-
-            # Get the count of .mp4 files in the chapter folder
-            file_count = self.count_files_in_folder(chapter_folder_id, 'mp4')
+            # The subtopic lookup and the file count only depend on the
+            # chapter folder, so run them concurrently
+            subtopic_future = self._executor.submit(
+                self.get_or_create_folder, subtopic_name, chapter_folder_id
+            )
+            count_future = self._executor.submit(
+                self.count_files_in_folder, chapter_folder_id, 'mp4'
+            )
+            subtopic_folder_id = subtopic_future.result()
+            file_count = count_future.result()
             class_number = file_count + 1
 
-            # Get the file extension
-            _, ext = os.path.splitext(filepath)
-            
             # Create the new filename with class number
-            new_filename = f"{class_name}_{chapter_name}_{subtopic_name}_{datetime.now().strftime('%d-%m-%Y')}_Class_{class_number}{ext}"
+            if date_str is None:
+                date_str = datetime.now().strftime('%d-%m-%Y')
+            new_filename = self.FILENAME_TEMPLATE.format(
+                class_name=class_name,
+                chapter_name=chapter_name,
+                subtopic_name=subtopic_name,
+                date=date_str,
+                number=class_number,
+                ext=Path(filepath).suffix
+            )
 
             file_metadata = {
                 'name': new_filename,
                 'parents': [subtopic_folder_id]
             }
 
-            # Create a MediaFileUpload object with resumable upload enabled
+            # Create a MediaFileUpload object with resumable upload enabled.
+            # Small files go up in a single request; large ones use big
+            # chunks since every chunk is a separate HTTPS round trip.
+            file_size = os.path.getsize(filepath)
+            chunksize = -1 if file_size < 5 * 1024 * 1024 else self.UPLOAD_CHUNK_SIZE
             media = MediaFileUpload(
                 filepath,
                 resumable=True,
-                chunksize=1024*1024  # 1MB chunks
+                chunksize=chunksize
             )
 
             # Create the file upload request
@@ -186,8 +343,9 @@ class GoogleDriveManager:
 
             # Upload the file with progress tracking
             response = None
+            http = self._thread_http()
             while response is None:
-                status, response = request.next_chunk()
+                status, response = request.next_chunk(http=http)
                 if status and progress_callback:
                     # status.progress() returns a float between 0 and 1
                     progress = int(status.progress() * 100)
@@ -206,10 +364,29 @@ class GoogleDriveManager:
             logger.error(f"Error uploading file: {str(e)}")
             raise
 
+    def upload_file_async(self, filepath, class_name: str, chapter_name: str, year: str, subtopic_name: str = "Main", progress_callback=None, date_str: str = None):
+        """
+        Upload a file on a background worker and return a Future.
+
+        The returned concurrent.futures.Future resolves to the uploaded
+        file ID. progress_callback runs on the worker thread, so Qt
+        consumers must marshal updates back via signals.
+        """
+        return self._upload_pool.submit(
+            self.upload_file,
+            filepath,
+            class_name,
+            chapter_name,
+            year,
+            subtopic_name,
+            progress_callback=progress_callback,
+            date_str=date_str
+        )
+
     def get_file_info(self, file_id):
         """Get file information from Drive."""
         try:
-            return self.service.files().get(fileId=file_id).execute()
+            return self.service.files().get(fileId=file_id).execute(http=self._thread_http())
         except Exception as e:
             logger.error(f"Error getting file info: {str(e)}")
             return None
@@ -217,7 +394,7 @@ class GoogleDriveManager:
     def delete_file(self, file_id):
         """Delete a file from Drive."""
         try:
-            self.service.files().delete(fileId=file_id).execute()
+            self.service.files().delete(fileId=file_id).execute(http=self._thread_http())
             return True
         except Exception as e:
             logger.error(f"Error deleting file: {str(e)}")
@@ -227,9 +404,9 @@ class GoogleDriveManager:
         """Get the file path in Drive."""
         try:
             file = self.service.files().get(
-                fileId=file_id, 
+                fileId=file_id,
                 fields='name, parents'
-            ).execute()
+            ).execute(http=self._thread_http())
             
             path = file.get('name', '')
             
@@ -238,9 +415,9 @@ class GoogleDriveManager:
                 parent_id = file['parents'][0]
                 try:
                     parent = self.service.files().get(
-                        fileId=parent_id, 
+                        fileId=parent_id,
                         fields='name, parents'
-                    ).execute()
+                    ).execute(http=self._thread_http())
                     parent_path = parent.get('name', '')
                     
                     # Get the grandparent folder name
@@ -248,9 +425,9 @@ class GoogleDriveManager:
                         grandparent_id = parent['parents'][0]
                         try:
                             grandparent = self.service.files().get(
-                                fileId=grandparent_id, 
+                                fileId=grandparent_id,
                                 fields='name'
-                            ).execute()
+                            ).execute(http=self._thread_http())
                             return f"{grandparent['name']} > {parent_path} > {path}"
                         except:
                             return f"{parent_path} > {path}"
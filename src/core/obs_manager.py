@@ -3,26 +3,84 @@ OBS WebSocket manager for handling recording operations.
 """
 
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 import time
 import json
 import os
+import random
+import shutil
 import subprocess
 import obsws_python as obs
+from obsws_python.error import OBSSDKError
+from websocket import WebSocketException
 from .google_drive_manager import GoogleDriveManager
 
 logger = logging.getLogger(__name__)
 
+# Exceptions the OBS client raises during normal operation (request
+# failures, dropped connections). obsws_python lets the underlying
+# websocket-client errors propagate unwrapped, and those subclass
+# WebSocketException rather than OSError, so it must be listed here.
+# Programmer errors are left to propagate.
+_OBS_ERRORS = (OBSSDKError, WebSocketException, OSError, TimeoutError)
+
+
+class _LazyJson:
+    """Defers JSON pretty-printing until a log handler actually emits it."""
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self):
+        return json.dumps(self.obj, indent=2, default=str)
+
+
+def _active(status) -> Optional[bool]:
+    """Recording state from a GetRecordStatus response, or None if absent.
+
+    Cheaper than the hasattr-then-access idiom on the hot polling paths:
+    no exception frame, one attribute lookup.
+    """
+    return getattr(status, 'output_active', None)
+
 
 class OBSManager:
     """Manager class for OBS WebSocket interactions."""
-    
-    def __init__(self, host: str = "localhost", port: int = 4455, password: str = ""):
+
+    __slots__ = (
+        'host', 'port', 'password', 'max_connect_attempts', 'connect_backoff_base',
+        'client', 'is_connected', 'is_recording', 'version_info',
+        'recording_path', 'recording_filename', 'debug_info', 'has_scenes',
+        '_setup_checked_at', 'last_recording_path', '_drive_manager',
+        'event_client', '_record_started', '_record_stopped', '_event_output_path',
+        '_writable_dirs', '_keepalive_thread', '_keepalive_stop', '_conn_lock',
+        '_upload_executor', '_method_cache_file', '_working_recording_method',
+        '_profile_params', '_status_cache', '_status_cache_at',
+    )
+
+    # How long a scene-setup check stays valid before re-probing OBS
+    _SETUP_TTL = 5.0
+
+    # Interval between keep-alive pings on the long-lived connection
+    _KEEPALIVE_INTERVAL = 30.0
+
+    # Minimum free space required in the recording directory
+    _MIN_FREE_BYTES = 1 << 30
+
+    # How long a polled recording status stays fresh
+    _STATUS_TTL = 0.25
+
+    def __init__(self, host: str = "localhost", port: int = 4455, password: str = "",
+                 max_connect_attempts: int = 3, connect_backoff_base: float = 0.5):
         """Initialize OBS WebSocket connection."""
         self.host = host
         self.port = port
         self.password = password
+        self.max_connect_attempts = max_connect_attempts
+        self.connect_backoff_base = connect_backoff_base
         self.client: Optional[obs.ReqClient] = None
         self.is_connected = False
         self.is_recording = False
@@ -31,38 +89,216 @@ class OBSManager:
         self.recording_filename = None
         self.debug_info = {}
         self.has_scenes = False
+        self._setup_checked_at = 0.0
         self.last_recording_path = None  # Store the path of the last recording
-        self.drive_manager = GoogleDriveManager()  # Initialize Google Drive manager
+        self._drive_manager: Optional[GoogleDriveManager] = None  # Constructed on first use
+
+        # Event-driven record-state tracking (RecordStateChanged events)
+        self.event_client: Optional[obs.EventClient] = None
+        self._record_started = threading.Event()
+        self._record_stopped = threading.Event()
+        self._event_output_path: Optional[str] = None
+
+        # Directories already verified writable, to skip repeat write probes
+        self._writable_dirs: set = set()
+
+        # Keep-alive ping thread for the long-lived connection
+        self._keepalive_thread: Optional[threading.Thread] = None
+        self._keepalive_stop = threading.Event()
+
+        # Serializes client setup/teardown between the GUI thread and the
+        # keepalive thread; reentrant because connect() tears down first
+        self._conn_lock = threading.RLock()
+
+        # Uploads run here so a multi-GB transfer never blocks the caller
+        self._upload_executor = ThreadPoolExecutor(max_workers=2)
+
+        # Last profile-parameter values we set, to skip redundant writes
+        self._profile_params: Dict[tuple, str] = {}
+
+        # Short-lived cache of the polled recording status
+        self._status_cache: Optional[bool] = None
+        self._status_cache_at = 0.0
+
+        # Recording method that last worked, so we skip the fallback ladder
+        self._method_cache_file = GoogleDriveManager._get_app_data_dir() / "obs_method_cache.json"
+        self._working_recording_method: Optional[int] = self._load_recording_method()
     
+    @property
+    def drive_manager(self) -> GoogleDriveManager:
+        """Google Drive manager, constructed lazily on first use.
+
+        Sessions that only record never pay the credential load and
+        service build.
+        """
+        if self._drive_manager is None:
+            self._drive_manager = GoogleDriveManager()
+        return self._drive_manager
+
     def connect(self) -> bool:
         """Connect to OBS WebSocket server."""
+        with self._conn_lock:
+            try:
+                # Drop any previous clients first; reconnecting over them
+                # would leak the old event client's websocket and listener
+                self._teardown_clients()
+
+                logger.info(f"Attempting to connect to OBS WebSocket at ws://{self.host}:{self.port}")
+                # Bounded exponential backoff smooths over the race where OBS is
+                # still starting its WebSocket server when we launch
+                for attempt in range(self.max_connect_attempts):
+                    try:
+                        self.client = obs.ReqClient(host=self.host, port=self.port, password=self.password)
+                        break
+                    except Exception as conn_err:
+                        if attempt == self.max_connect_attempts - 1:
+                            raise
+                        delay = min(self.connect_backoff_base * 2 ** attempt + random.uniform(0, 0.5), 30)
+                        logger.warning(f"Connection attempt {attempt + 1} failed: {conn_err}. "
+                                       f"Retrying in {delay:.1f}s")
+                        time.sleep(delay)
+                self.is_connected = True
+                logger.info("Connected to OBS WebSocket server")
+
+                # Subscribe to record-state events so stops don't need to poll
+                try:
+                    self.event_client = obs.EventClient(host=self.host, port=self.port, password=self.password)
+                    self.event_client.callback.register(self.on_record_state_changed)
+                except Exception as event_err:
+                    logger.warning(f"Could not subscribe to OBS events: {event_err}")
+                    self.event_client = None
+
+                # Fetch version, scenes and recording settings in one pass
+                self._probe_obs_state()
+
+                # Keep the connection alive rather than re-handshaking later
+                self._start_keepalive()
+
+                return True
+            except Exception as e:
+                logger.error(f"Failed to connect to OBS WebSocket server: {e}", exc_info=True)
+                self.is_connected = False
+                return False
+    
+    def _load_recording_method(self) -> Optional[int]:
+        """Load the cached working recording method, if one was persisted."""
         try:
-            logger.info(f"Attempting to connect to OBS WebSocket at ws://{self.host}:{self.port}")
-            self.client = obs.ReqClient(host=self.host, port=self.port, password=self.password)
-            self.is_connected = True
-            logger.info("Connected to OBS WebSocket server")
-            
-            # Get OBS version information
-            self._get_obs_version()
-            
-            # Verify OBS is ready for recording
-            self._check_obs_recording_setup()
-            
-            # Check current recording settings
-            self._check_recording_settings()
-            
+            if self._method_cache_file.exists():
+                with self._method_cache_file.open('r', encoding='utf-8') as f:
+                    method = json.load(f).get('recording_method')
+                if method in (1, 2, 3):
+                    return method
+        except Exception as e:
+            logger.warning(f"Could not load cached recording method: {e}")
+        return None
+
+    def _save_recording_method(self, method: int) -> None:
+        """Persist the working recording method for future sessions."""
+        if method == self._working_recording_method:
+            return
+        self._working_recording_method = method
+        try:
+            self._method_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with self._method_cache_file.open('w', encoding='utf-8') as f:
+                json.dump({'recording_method': method}, f)
+        except Exception as e:
+            logger.warning(f"Could not save recording method cache: {e}")
+
+    def _start_keepalive(self) -> None:
+        """Start the background ping thread if it isn't already running."""
+        if self._keepalive_thread is not None and self._keepalive_thread.is_alive():
+            return
+        self._keepalive_stop.clear()
+        self._keepalive_thread = threading.Thread(
+            target=self._keepalive_loop, name="obs-keepalive", daemon=True
+        )
+        self._keepalive_thread.start()
+
+    def _keepalive_loop(self) -> None:
+        """Ping OBS periodically; reconnect with backoff if the link drops."""
+        while not self._keepalive_stop.wait(self._KEEPALIVE_INTERVAL):
+            if not self.is_connected or self.client is None:
+                continue
+            try:
+                self.client.get_version()
+            except _OBS_ERRORS as e:
+                logger.warning("Keep-alive ping failed: %s. Reconnecting...", e)
+                self.is_connected = False
+                # connect() tears the dead clients down under the
+                # connection lock - the same path GUI reconnects take
+                self.connect()
+
+    def _is_dir_writable(self, directory) -> bool:
+        """
+        Check that a directory is writable and has room for a recording,
+        caching positive results.
+
+        Uses os.access plus a free-space check (one stat + one statfs)
+        instead of writing and unlinking a probe file, which can cost
+        100+ ms on Windows with antivirus hooks.
+        """
+        directory = Path(directory)
+        if directory in self._writable_dirs:
+            return True
+        try:
+            if not os.access(directory, os.W_OK):
+                logger.warning(f"Directory {directory} is not writable")
+                return False
+            free = shutil.disk_usage(directory).free
+            if free < self._MIN_FREE_BYTES:
+                logger.warning(f"Directory {directory} has only {free} bytes free")
+                return False
+            self._writable_dirs.add(directory)
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to OBS WebSocket server: {e}", exc_info=True)
-            self.is_connected = False
+            logger.warning(f"Could not check directory {directory}: {e}")
+            self._writable_dirs.discard(directory)
             return False
-    
-    def _get_obs_version(self) -> None:
+
+    def on_record_state_changed(self, data) -> None:
+        """Handle RecordStateChanged events from OBS."""
+        state = getattr(data, 'output_state', None)
+        logger.info(f"Record state changed: {state}")
+        if state == 'OBS_WEBSOCKET_OUTPUT_STARTED':
+            self._record_started.set()
+        elif state == 'OBS_WEBSOCKET_OUTPUT_STOPPED':
+            self._event_output_path = getattr(data, 'output_path', None)
+            self._record_stopped.set()
+
+    def _probe_obs_state(self) -> None:
+        """
+        Issue the post-connect state requests together and dispatch the
+        responses into the existing parse helpers.
+
+        obsws_python's ReqClient has no public RequestBatch support, so the
+        requests still travel individually, but grouping them here keeps the
+        probe to a single pass with no redundant calls in between.
+        """
+        def fetch(label, fn, **kwargs):
+            try:
+                return fn(**kwargs)
+            except _OBS_ERRORS as e:
+                logger.warning("Could not fetch %s: %s", label, e)
+                return None
+
+        version = fetch('OBS version', self.client.get_version)
+        scenes_info = fetch('scene list', self.client.get_scene_list)
+        rec_path = fetch('recording path', self.client.get_profile_parameter,
+                         category="Output", name="RecFilePath")
+        rec_format = fetch('recording format', self.client.get_profile_parameter,
+                           category="Output", name="RecFormat")
+
+        self._get_obs_version(version)
+        self._check_obs_recording_setup(scenes_info)
+        self._check_recording_settings(rec_path, rec_format)
+
+    def _get_obs_version(self, version=None) -> None:
         """Get OBS version information."""
         try:
-            version = self.client.get_version()
+            if version is None:
+                version = self.client.get_version()
             logger.info(f"OBS Version info: {version}")
-            
+
             self.version_info = {
                 'obs_version': version.obs_version,
                 'websocket_version': version.obs_web_socket_version
@@ -73,18 +309,19 @@ class OBSManager:
             logger.warning(f"Could not get OBS version: {e}")
             self.version_info = {'obs_version': 'unknown', 'websocket_version': 'unknown'}
     
-    def _check_obs_recording_setup(self) -> None:
+    def _check_obs_recording_setup(self, scenes_info=None) -> None:
         """Check if OBS is set up correctly for recording."""
         try:
             # Set default value
             self.has_scenes = False
-            
+
             # Debug log current connection state
             logger.info(f"Checking OBS setup with connection state: {self.is_connected}")
-            
+
             # Check if there's at least one scene
             try:
-                scenes_info = self.client.get_scene_list()
+                if scenes_info is None:
+                    scenes_info = self.client.get_scene_list()
                 logger.info(f"Scene list response: {scenes_info}")
                 
                 if hasattr(scenes_info, 'scenes') and scenes_info.scenes:
@@ -111,7 +348,8 @@ class OBSManager:
                 
             # Log the final decision
             logger.info(f"Final scene detection result: has_scenes = {self.has_scenes}")
-            
+            self._setup_checked_at = time.monotonic()
+
         except Exception as e:
             logger.warning(f"Failed to check OBS recording setup: {e}")
             logger.warning("Recording may not work correctly - please check OBS settings")
@@ -120,29 +358,28 @@ class OBSManager:
                 logger.warning("Assuming scenes exist since OBS is connected")
                 self.has_scenes = True
 
-    def _check_recording_settings(self) -> None:
+    def _check_recording_settings(self, response=None, format_response=None) -> None:
         """Check current recording settings in OBS."""
         try:
             # Try to get profile settings
             try:
-                response = self.client.get_profile_parameter(category="Output", name="RecFilePath")
+                if response is None:
+                    response = self.client.get_profile_parameter(category="Output", name="RecFilePath")
                 logger.info(f"Current recording path setting: {response}")
-                if hasattr(response, 'parameter_value'):
+                # Single attribute resolution on the common success path
+                # instead of a hasattr probe plus a second lookup
+                try:
                     self.recording_path = response.parameter_value
+                except AttributeError:
+                    pass
+                else:
                     logger.info(f"OBS is set to save recordings to: {self.recording_path}")
-                    
+
                     # Verify if directory exists and is writable
-                    if os.path.exists(self.recording_path):
+                    if Path(self.recording_path).exists():
                         logger.info(f"Recording directory exists: {self.recording_path}")
-                        # Check if writable
-                        try:
-                            test_file = os.path.join(self.recording_path, "obs_test_write.tmp")
-                            with open(test_file, 'w') as f:
-                                f.write("test")
-                            os.remove(test_file)
+                        if self._is_dir_writable(self.recording_path):
                             logger.info(f"Recording directory is writable: {self.recording_path}")
-                        except Exception as write_err:
-                            logger.warning(f"Recording directory is not writable: {write_err}")
                     else:
                         logger.warning(f"Recording directory does not exist: {self.recording_path}")
             except Exception as e:
@@ -151,9 +388,12 @@ class OBSManager:
             
             # Try to get recording format
             try:
-                format_response = self.client.get_profile_parameter(category="Output", name="RecFormat")
-                if hasattr(format_response, 'parameter_value'):
+                if format_response is None:
+                    format_response = self.client.get_profile_parameter(category="Output", name="RecFormat")
+                try:
                     logger.info(f"Current recording format: {format_response.parameter_value}")
+                except AttributeError:
+                    pass
             except Exception as format_err:
                 logger.warning(f"Could not get recording format: {format_err}")
                 
@@ -162,19 +402,39 @@ class OBSManager:
             self.recording_path = "unknown"
 
     def is_ready_for_recording(self) -> bool:
-        """Check if OBS is ready for recording."""
+        """Check if OBS is ready for recording (scene check cached with a TTL)."""
         if not self.is_connected:
             return False
-            
-        if not hasattr(self, 'has_scenes'):
+
+        # Only re-probe OBS when the last check has gone stale, so UI
+        # polling doesn't flood OBS with GetSceneList requests
+        if time.monotonic() - self._setup_checked_at > self._SETUP_TTL:
             self._check_obs_recording_setup()
-            
+
         return self.is_connected and self.has_scenes
         
+    def _teardown_clients(self) -> None:
+        """Drop the request and event clients.
+
+        Disconnects the event client so its websocket and listener thread
+        aren't leaked on reconnect; shared by disconnect(), connect() and
+        (through the latter) the keepalive recovery path.
+        """
+        with self._conn_lock:
+            if self.event_client is not None:
+                try:
+                    self.event_client.disconnect()
+                except Exception as e:
+                    logger.warning(f"Error disconnecting event client: {e}")
+                self.event_client = None
+            self.client = None
+            self.is_connected = False
+            self._setup_checked_at = 0.0
+
     def disconnect(self) -> None:
         """Disconnect from OBS WebSocket server."""
-        self.client = None
-        self.is_connected = False
+        self._keepalive_stop.set()
+        self._teardown_clients()
         logger.info("Disconnected from OBS WebSocket server")
     
     def start_recording(self, output_path: Path) -> bool:
@@ -216,16 +476,12 @@ class OBSManager:
                     self.debug_info['errors'].append(error_msg)
                     return False
             
-            # Check if directory is writable by creating a test file
-            try:
-                test_file = output_path.parent / "test_write.tmp"
-                with open(test_file, 'w') as f:
-                    f.write("test")
-                test_file.unlink()  # Delete test file
+            # Check if directory is writable (cached after the first probe)
+            if self._is_dir_writable(output_path.parent):
                 logger.info(f"Directory {output_path.parent} is writable")
                 self.debug_info['directory_writable'] = True
-            except Exception as e:
-                error_msg = f"Directory {output_path.parent} is not writable: {e}"
+            else:
+                error_msg = f"Directory {output_path.parent} is not writable"
                 logger.error(error_msg)
                 self.debug_info['errors'].append(error_msg)
                 self.debug_info['directory_writable'] = False
@@ -242,7 +498,7 @@ class OBSManager:
                 self.debug_info['recording_status_before'] = str(status)
                 
                 # If already recording, we need to stop it first
-                if hasattr(status, 'output_active') and status.output_active:
+                if _active(status):
                     logger.warning("OBS is already recording. Stopping current recording first.")
                     stop_result = self.client.stop_record()
                     logger.info(f"Stopped existing recording: {stop_result}")
@@ -252,37 +508,37 @@ class OBSManager:
                 logger.warning(f"Could not get recording status: {e}")
                 self.debug_info['errors'].append(f"Get recording status error: {str(e)}")
             
-            # Try each recording method in sequence
-            
-            # Method 1: Set output directory and start recording
-            success = self._try_recording_method_1(output_path)
-            if success:
-                return True
-                
-            # Method 2: Set profile parameters
-            success = self._try_recording_method_2(output_path)
-            if success:
-                return True
-                
-            # Method 3: Direct recording
-            success = self._try_recording_method_3(output_path)
-            if success:
-                return True
-                
+            # Try the recording methods, starting with the one that last
+            # worked (cached across sessions) before falling through the ladder
+            methods = {
+                1: self._try_recording_method_1,
+                2: self._try_recording_method_2,
+                3: self._try_recording_method_3,
+            }
+            order = list(methods)
+            if self._working_recording_method in methods:
+                order.remove(self._working_recording_method)
+                order.insert(0, self._working_recording_method)
+
+            for method_number in order:
+                if methods[method_number](output_path):
+                    self._save_recording_method(method_number)
+                    return True
+
             # If all methods failed, set recording state manually and hope for the best
             logger.warning("All recording methods failed. Setting recording state manually.")
             self.is_recording = True
             logger.info(f"Recording to: {output_path} (state set manually)")
             
             # Dump debug info
-            logger.info(f"Recording debug info: {json.dumps(self.debug_info, indent=2)}")
+            logger.info("Recording debug info: %s", _LazyJson(self.debug_info))
             
             return True
                 
         except Exception as e:
             logger.error(f"Failed to start recording: {e}", exc_info=True)
             self.debug_info['errors'].append(f"Fatal error: {str(e)}")
-            logger.info(f"Recording debug info: {json.dumps(self.debug_info, indent=2)}")
+            logger.info("Recording debug info: %s", _LazyJson(self.debug_info))
             return False
     
     def _try_recording_method_1(self, output_path: Path) -> bool:
@@ -305,6 +561,7 @@ class OBSManager:
             # Start recording
             logger.info("METHOD 1: Starting recording...")
             try:
+                self._record_started.clear()
                 self.client.start_record()
                 logger.info("Recording started successfully")
                 method_info['recording_started'] = True
@@ -313,11 +570,8 @@ class OBSManager:
                 method_info['start_error'] = str(start_err)
                 return False
             
-            # Wait a moment
-            time.sleep(1)
-            
-            # Verify recording actually started
-            status = self._check_recording_status()
+            # Verify recording actually started (event-driven when possible)
+            status = self._wait_record_started()
             method_info['status_after'] = status
             
             if status:
@@ -341,20 +595,20 @@ class OBSManager:
         
         try:
             logger.info(f"METHOD 2: Setting recording parameters for: {output_path}")
-            
-            # Set recording path
+
+            # Set recording path (skipped when OBS already has this value)
             try:
-                self.client.set_profile_parameter(category="Output", name="RecFilePath", value=str(output_path.parent))
-                logger.info(f"Set recording path to: {output_path.parent}")
+                if self._set_profile_parameter_cached("Output", "RecFilePath", str(output_path.parent)):
+                    logger.info(f"Set recording path to: {output_path.parent}")
                 method_info['path_set'] = True
             except Exception as path_err:
                 logger.warning(f"Failed to set recording path: {path_err}")
                 method_info['path_error'] = str(path_err)
-            
+
             # Try to set other parameters that might help
             try:
-                self.client.set_profile_parameter(category="Output", name="RecFormat", value="mp4")
-                logger.info("Set recording format to mp4")
+                if self._set_profile_parameter_cached("Output", "RecFormat", "mp4"):
+                    logger.info("Set recording format to mp4")
                 method_info['format_set'] = True
             except Exception as format_err:
                 logger.warning(f"Failed to set recording format: {format_err}")
@@ -363,6 +617,7 @@ class OBSManager:
             # Start recording
             logger.info("METHOD 2: Starting recording...")
             try:
+                self._record_started.clear()
                 self.client.start_record()
                 logger.info("Recording started successfully")
                 method_info['recording_started'] = True
@@ -371,11 +626,8 @@ class OBSManager:
                 method_info['start_error'] = str(start_err)
                 return False
             
-            # Wait a moment
-            time.sleep(1)
-            
-            # Verify recording actually started
-            status = self._check_recording_status()
+            # Verify recording actually started (event-driven when possible)
+            status = self._wait_record_started()
             method_info['status_after'] = status
             
             if status:
@@ -401,6 +653,7 @@ class OBSManager:
             # Just try to start recording directly
             logger.info("METHOD 3: Starting recording directly...")
             try:
+                self._record_started.clear()
                 self.client.start_record()
                 logger.info("Recording started successfully")
                 method_info['recording_started'] = True
@@ -409,11 +662,8 @@ class OBSManager:
                 method_info['start_error'] = str(start_err)
                 return False
             
-            # Wait a moment
-            time.sleep(1)
-            
-            # Verify recording actually started
-            status = self._check_recording_status()
+            # Verify recording actually started (event-driven when possible)
+            status = self._wait_record_started()
             method_info['status_after'] = status
             
             if status:
@@ -430,28 +680,69 @@ class OBSManager:
             method_info['error'] = str(e)
             return False
     
-    def _check_recording_status(self) -> bool:
-        """Check if recording is actually active."""
+    def _set_profile_parameter_cached(self, category: str, name: str, value: str) -> bool:
+        """
+        Set an OBS profile parameter, skipping the round trip when the same
+        value was already written this session.
+
+        Returns True when a request was actually sent.
+        """
+        key = (category, name)
+        if self._profile_params.get(key) == value:
+            return False
+        self.client.set_profile_parameter(category=category, name=name, value=value)
+        self._profile_params[key] = value
+        return True
+
+    def _wait_record_started(self, timeout: float = 1.5) -> bool:
+        """
+        Wait for OBS to confirm recording started.
+
+        Returns as soon as the RecordStateChanged event arrives (typically
+        milliseconds); falls back to the old sleep-and-poll check when the
+        event subscription is unavailable.
+        """
+        if self.event_client is not None:
+            if self._record_started.wait(timeout):
+                return True
+            logger.warning("No record-start event received, polling status")
+            return self._check_recording_status(force=True)
+        time.sleep(1)
+        return self._check_recording_status(force=True)
+
+    def _check_recording_status(self, force: bool = False) -> bool:
+        """
+        Check if recording is actually active.
+
+        Results are cached briefly so back-to-back verification attempts
+        (e.g. falling through the method ladder) don't re-query OBS; pass
+        force=True right after a state change.
+        """
+        if (not force and self._status_cache is not None
+                and time.monotonic() - self._status_cache_at < self._STATUS_TTL):
+            return self._status_cache
         try:
             # Get recording status
             try:
                 status = self.client.get_record_status()
                 logger.info(f"Recording status check: {status}")
                 self.debug_info['recording_status_after'] = str(status)
-                
-                if hasattr(status, 'output_active'):
-                    recording = status.output_active
+
+                recording = _active(status)
+                if recording is not None:
                     logger.info(f"Recording status from output_active: {recording}")
+                    self._status_cache = recording
+                    self._status_cache_at = time.monotonic()
                     return recording
-            except Exception as e:
-                logger.warning(f"Could not get recording status: {e}")
-            
+            except _OBS_ERRORS as e:
+                logger.warning("Could not get recording status: %s", e)
+
             # If we can't determine, assume it's working
             logger.warning("Could not determine recording status. Assuming it's recording.")
             return True
-            
-        except Exception as e:
-            logger.error(f"Error checking recording status: {e}")
+
+        except _OBS_ERRORS as e:
+            logger.error("Error checking recording status: %s", e)
             return True  # Assume it's working if we can't check
     
     def stop_recording(self) -> bool:
@@ -476,23 +767,28 @@ class OBSManager:
         }
         
         try:
-            # Check recording status before stopping
-            try:
-                status = self.client.get_record_status()
-                logger.info(f"Recording status before stopping: {status}")
-                stop_debug['recording_status_before'] = str(status)
-                
-                # If not recording according to OBS, just update our state
-                if hasattr(status, 'output_active') and not status.output_active:
-                    logger.warning("OBS reports it's not recording. Updating internal state.")
-                    self.is_recording = False
-                    stop_debug['not_recording_according_to_obs'] = True
-            except Exception as e:
-                logger.warning(f"Could not get recording status before stopping: {e}")
-                stop_debug['errors'].append(f"Get status before error: {str(e)}")
-            
+            # Check recording status before stopping (debug builds only:
+            # stop_record below handles the not-recording case itself, so
+            # this is an extra round trip we skip in production)
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    status = self.client.get_record_status()
+                    logger.debug(f"Recording status before stopping: {status}")
+                    stop_debug['recording_status_before'] = str(status)
+
+                    # If not recording according to OBS, just update our state
+                    if _active(status) is False:
+                        logger.warning("OBS reports it's not recording. Updating internal state.")
+                        self.is_recording = False
+                        stop_debug['not_recording_according_to_obs'] = True
+                except Exception as e:
+                    logger.warning(f"Could not get recording status before stopping: {e}")
+                    stop_debug['errors'].append(f"Get status before error: {str(e)}")
+
             # Try to stop recording
             output_path = None
+            self._record_stopped.clear()
+            self._event_output_path = None
             try:
                 logger.info("Stopping recording...")
                 result = self.client.stop_record()
@@ -513,25 +809,46 @@ class OBSManager:
                 stop_debug['errors'].append(f"Stop recording error: {str(e)}")
                 self.is_recording = False  # Update state anyway
             
-            # Check recording status after stopping
-            try:
-                status = self.client.get_record_status()
-                logger.info(f"Recording status after stopping: {status}")
-                stop_debug['recording_status_after'] = str(status)
-            except Exception as e:
-                logger.warning(f"Could not get recording status after stopping: {e}")
-                stop_debug['errors'].append(f"Get status after error: {str(e)}")
-            
-            # Wait a bit longer for the file to be saved
-            logger.info("Waiting 5 seconds for file to be saved...")
-            time.sleep(5)
+            # Check recording status after stopping (debug builds only)
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    status = self.client.get_record_status()
+                    logger.debug(f"Recording status after stopping: {status}")
+                    stop_debug['recording_status_after'] = str(status)
+                except Exception as e:
+                    logger.warning(f"Could not get recording status after stopping: {e}")
+                    stop_debug['errors'].append(f"Get status after error: {str(e)}")
+
+            # Wait for OBS to confirm the output finished flushing. The
+            # RecordStateChanged event fires as soon as the file is closed;
+            # fall back to the old fixed sleep if events are unavailable.
+            # When the stop request itself failed (e.g. OBS wasn't
+            # recording) no event is coming, so don't wait for one.
+            if not stop_debug.get('success'):
+                logger.warning("Stop request failed; skipping record-stop wait")
+            elif self.event_client is not None:
+                if self._record_stopped.wait(timeout=30):
+                    logger.info("OBS confirmed recording output stopped")
+                    if self._event_output_path and not output_path:
+                        output_path = self._event_output_path
+                        self.last_recording_path = output_path
+                        logger.info(f"Output path from event: {output_path}")
+                else:
+                    logger.warning("Timed out waiting for record-stop event")
+            else:
+                logger.info("Waiting 5 seconds for file to be saved...")
+                time.sleep(5)
             logger.info("Stopped recording and waiting for file to be saved")
-            
-            # Try to directly check if file exists
+
+            # Try to directly check if file exists (single stat for both
+            # existence and size)
             if output_path:
-                if os.path.exists(output_path):
+                try:
+                    file_size = Path(output_path).stat().st_size
+                except OSError:
+                    file_size = None
+                if file_size is not None:
                     logger.info(f"Recording file exists: {output_path}")
-                    file_size = os.path.getsize(output_path)
                     logger.info(f"Recording file size: {file_size} bytes")
                     stop_debug['file_exists'] = True
                     stop_debug['file_size'] = file_size
@@ -549,7 +866,7 @@ class OBSManager:
                 self._check_recording_output_exists()
             
             # Log debug info
-            logger.info(f"Stop recording debug info: {json.dumps(stop_debug, indent=2)}")
+            logger.info("Stop recording debug info: %s", _LazyJson(stop_debug))
             logger.info(f"Final last_recording_path: {self.last_recording_path}")
             
             return True
@@ -557,7 +874,7 @@ class OBSManager:
         except Exception as e:
             logger.error(f"Failed to stop recording: {e}", exc_info=True)
             stop_debug['errors'].append(f"Fatal error: {str(e)}")
-            logger.info(f"Stop recording debug info: {json.dumps(stop_debug, indent=2)}")
+            logger.info("Stop recording debug info: %s", _LazyJson(stop_debug))
             self.is_recording = False  # Reset state anyway
             return False
     
@@ -568,16 +885,18 @@ class OBSManager:
                 logger.warning("No recording path or filename available")
                 return
 
-            # Look for the recording file with various extensions
-            possible_extensions = ['.mp4', '.mkv', '.flv', '.mov', '.avi']
+            # Look for the recording file with various extensions using a
+            # single directory listing instead of one stat per extension
+            possible_extensions = {'.mp4', '.mkv', '.flv', '.mov', '.avi'}
             recording_file = None
-            
-            for ext in possible_extensions:
-                test_path = os.path.join(self.recording_path, self.recording_filename + ext)
-                if os.path.exists(test_path):
-                    recording_file = test_path
-                    break
-            
+
+            with os.scandir(self.recording_path) as entries:
+                for entry in entries:
+                    name, ext = os.path.splitext(entry.name)
+                    if name == self.recording_filename and ext.lower() in possible_extensions:
+                        recording_file = entry.path
+                        break
+
             if recording_file:
                 logger.info(f"Found recording file: {recording_file}")
                 self.last_recording_path = recording_file
@@ -587,19 +906,27 @@ class OBSManager:
         except Exception as e:
             logger.error(f"Error checking recording output: {e}")
 
-    def upload_last_recording(self) -> Optional[str]:
+    def upload_last_recording(self) -> Future:
         """
-        Upload the last recording to Google Drive.
-        
+        Upload the last recording to Google Drive on a background worker.
+
         Returns:
-            Optional[str]: The file ID if upload was successful, None otherwise
+            Future: Resolves to the file ID if upload was successful, None otherwise
         """
+        return self._upload_executor.submit(self._upload_last_recording_impl)
+
+    def wait_uploads(self) -> None:
+        """Block until all pending uploads finish (e.g. at shutdown)."""
+        self._upload_executor.shutdown(wait=True)
+
+    def _upload_last_recording_impl(self) -> Optional[str]:
+        """Blocking upload of the last recording; runs on the upload executor."""
         try:
             if not self.last_recording_path:
                 logger.warning("No recording file available to upload")
                 return None
                 
-            if not os.path.exists(self.last_recording_path):
+            if not Path(self.last_recording_path).exists():
                 logger.error(f"Recording file not found at path: {self.last_recording_path}")
                 return None
                 
@@ -626,17 +953,17 @@ class OBSManager:
             status = self.client.get_record_status()
             logger.info(f"Recording status response: {status}")
             
-            if hasattr(status, 'output_active'):
-                recording = status.output_active
+            recording = _active(status)
+            if recording is not None:
                 logger.info(f"Recording status from output_active: {recording}")
                 return recording
             
             # Use our internal state as fallback
             logger.info(f"Using internal recording state: {self.is_recording}")
             return self.is_recording
-            
-        except Exception as e:
-            logger.error(f"Failed to get recording status: {e}")
+
+        except _OBS_ERRORS as e:
+            logger.error("Failed to get recording status: %s", e)
             return self.is_recording
             
     def get_debug_info(self) -> Dict[str, Any]:
@@ -655,33 +982,40 @@ class OBSManager:
             'recording_filename': self.recording_filename,
         }
         
-        # Add current OBS settings if connected
+        # Report the state we already track instead of re-querying OBS;
+        # callers that need live values use refresh_debug_info()
+        if self.is_connected:
+            debug_info['obs_info'] = {
+                'version': (self.version_info or {}).get('obs_version'),
+                'websocket_version': (self.version_info or {}).get('websocket_version'),
+                'is_recording': self.is_recording,
+                'recording_path': self.recording_path,
+            }
+
+        return debug_info
+
+    def refresh_debug_info(self) -> Dict[str, Any]:
+        """
+        Re-query OBS for live state before building the debug info.
+
+        Unlike get_debug_info, this costs WebSocket round trips; it's meant
+        for an explicit refresh action, not polling.
+        """
         if self.is_connected:
             try:
-                # Try to get basic info
-                debug_info['obs_info'] = {}
-                
-                try:
-                    version = self.client.get_version()
-                    debug_info['obs_info']['version'] = version.obs_version
-                    debug_info['obs_info']['websocket_version'] = version.obs_web_socket_version
-                except Exception as ve:
-                    debug_info['obs_info']['version_error'] = str(ve)
-                
-                try:
-                    status = self.client.get_record_status()
-                    debug_info['obs_info']['is_recording'] = status.output_active if hasattr(status, 'output_active') else False
-                except Exception as re:
-                    debug_info['obs_info']['recording_status_error'] = str(re)
-                    
-                # Try to get output settings
-                try:
-                    path_response = self.client.get_profile_parameter(category="Output", name="RecFilePath")
-                    debug_info['obs_info']['recording_path'] = path_response.parameter_value if hasattr(path_response, 'parameter_value') else None
-                except Exception as pe:
-                    debug_info['obs_info']['path_error'] = str(pe)
-                    
-            except Exception as e:
-                debug_info['obs_info_error'] = str(e)
-        
-        return debug_info 
\ No newline at end of file
+                self._get_obs_version()
+            except Exception as ve:
+                logger.warning(f"Could not refresh version info: {ve}")
+            try:
+                status = self.client.get_record_status()
+                recording = _active(status)
+                if recording is not None:
+                    self.is_recording = recording
+            except Exception as re:
+                logger.warning(f"Could not refresh recording status: {re}")
+            try:
+                self._check_recording_settings()
+            except Exception as pe:
+                logger.warning(f"Could not refresh recording settings: {pe}")
+
+        return self.get_debug_info() 
\ No newline at end of file
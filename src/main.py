@@ -4,25 +4,32 @@ Main entry point for the Google Drive Uploader application.
 
 import sys
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
-from src.ui.main_window import MainWindow
-from src.core.config import Config
-from src.utils.resources import get_icon_path
 
 
 def main():
     """Main application entry point."""
     # Create application
     app = QApplication(sys.argv)
-    
+
     # Set application style
     app.setStyle("Fusion")
-    
-    # Set application icon
-    icon_path = get_icon_path()
-    if icon_path:
-        app.setWindowIcon(QIcon(str(icon_path)))
-    
+
+    # Import the heavy modules (UI tree, OBS manager, Drive SDK) only after
+    # the application object exists, so Qt's startup work isn't serialized
+    # behind them
+    from src.ui.main_window import MainWindow, UIConstants
+    from src.core.config import Config
+    from src.utils.resources import get_app_icon
+
+    # One app-wide stylesheet; widgets select into it via object names
+    # and the buttonStyle/labelRole properties
+    app.setStyleSheet(UIConstants.APP_QSS)
+
+    # Set application icon (shared QIcon, decoded once)
+    icon = get_app_icon()
+    if icon:
+        app.setWindowIcon(icon)
+
     # Load configuration
     config = Config()
     
@@ -3,39 +3,52 @@ Base classes for UI components.
 """
 
 from typing import Optional
-from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QWidget, QMessageBox
+from PyQt6.QtCore import Qt, pyqtSignal
 from src.core.config import Config
 
 
 class BaseWidget(QWidget):
     """Base class for all custom widgets."""
-    
+
+    # Status updates go through Qt's signal dispatch; an emit with no
+    # connections short-circuits in C++ instead of entering a Python frame
+    status_changed = pyqtSignal(str, bool)
+
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize the widget."""
         super().__init__(parent)
-        self.config = Config()
-        self.setup_ui()
-    
+        self.config = Config.instance()
+        self._ui_ready = False
+
     def setup_ui(self) -> None:
         """Setup the UI components. Override in subclasses."""
-        raise NotImplementedError
-    
+        pass
+
+    def ensure_ui(self) -> None:
+        """Run setup_ui exactly once, on demand."""
+        if not self._ui_ready:
+            self._ui_ready = True
+            self.setup_ui()
+
+    def showEvent(self, event) -> None:
+        """Build the UI lazily, the first time the widget becomes visible."""
+        self.ensure_ui()
+        super().showEvent(event)
+
+
     def show_error(self, message: str) -> None:
         """Show an error message."""
-        from PyQt6.QtWidgets import QMessageBox
         QMessageBox.critical(self, "Error", message)
-    
+
     def show_info(self, message: str) -> None:
         """Show an information message."""
-        from PyQt6.QtWidgets import QMessageBox
         QMessageBox.information(self, "Information", message)
-    
+
     def show_warning(self, message: str) -> None:
         """Show a warning message."""
-        from PyQt6.QtWidgets import QMessageBox
         QMessageBox.warning(self, "Warning", message)
     
     def set_status(self, message: str, is_error: bool = False) -> None:
-        """Set status message. Override in subclasses if needed."""
-        pass 
\ No newline at end of file
+        """Publish a status message via the status_changed signal."""
+        self.status_changed.emit(message, is_error)
\ No newline at end of file
@@ -17,32 +17,92 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QInputDialog,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import (
+    Qt,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+    QTimer,
+    QElapsedTimer,
+    QSignalBlocker,
+    QFileSystemWatcher,
+)
+from PyQt6.QtGui import QStandardItemModel, QStandardItem
 from src.ui.base import BaseWidget
 from src.core.config import Config
-from src.core.obs_manager import OBSManager
-from src.utils.resources import get_icon_path
+from src.utils.resources import get_app_icon
 import logging
-from datetime import datetime
+import os
+import re
+from datetime import date, datetime, timedelta
+from enum import Enum
+from functools import lru_cache
 import time
 
+# INFO by default; set LOG_LEVEL=DEBUG to re-enable the verbose output
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Strips anything that isn't a word character (Unicode-aware, matching
+# the old isalnum() filter), space, underscore or hyphen from
+# user-entered names; single C-level pass instead of a per-character
+# Python loop
+_SAFE_NAME_RE = re.compile(r'[^\w \-]')
+
+
+def _sanitize(name: str) -> str:
+    """Return name with filesystem-unfriendly characters removed."""
+    return _SAFE_NAME_RE.sub('', name)
+
+
+@lru_cache(maxsize=2)
+def _format_day(ordinal: int) -> str:
+    """Render DD-MM-YYYY for an ordinal day, hitting strftime once per day."""
+    return date.fromordinal(ordinal).strftime("%d-%m-%Y")
+
+
+def _today_str() -> str:
+    """Today's date in filename format, cached for the rest of the day."""
+    return _format_day(date.today().toordinal())
+
+
+# Container formats OBS can record to; endswith takes the tuple in one
+# C-level call, so no per-extension pass over the directory is needed
+_VIDEO_SUFFIXES = ('.mp4', '.mkv', '.flv', '.mov')
+
+# Default places OBS may drop recordings, resolved once at import
+_OBS_DEFAULT_DIRS = (
+    Path.home() / "Videos",
+    Path("C:/Users") / Path.home().name / "Videos",
+    Path.cwd() / "recordings",
+    Path("C:/Program Files/obs-studio"),
+    Path("C:/Program Files (x86)/obs-studio"),
+)
+
+
+class UploadSignals(QObject):
+    """Signal holder for UploadWorker (QRunnable can't declare signals)."""
 
-class UploadWorker(QThread):
-    """Worker thread for file uploads."""
-    
     progress = pyqtSignal(int)
     finished = pyqtSignal(bool, str)
-    
+
+
+class UploadWorker(QRunnable):
+    """Worker for file uploads, run on the shared Qt thread pool.
+
+    Unlike a QThread subclass, pool runnables don't spawn a fresh OS
+    thread per upload and are reclaimed when done.
+    """
+
     def __init__(self, file_path: Path, drive_manager, class_name: str, chapter_name: str, current_year: str, subtopic_name: str = "Main"):
         """Initialize the worker."""
         super().__init__()
+        self.signals = UploadSignals()
+        self._last_pct = -1
         self.file_path = file_path
         self.drive_manager = drive_manager
         self.class_name = class_name
@@ -54,8 +114,13 @@ class UploadWorker(QThread):
         """Run the upload process."""
         try:
             def progress_callback(progress: int):
-                self.progress.emit(progress)
-            
+                # Emit only when the integer percent moves; per-chunk
+                # callbacks would otherwise queue thousands of
+                # cross-thread events on the main loop
+                if progress != self._last_pct:
+                    self._last_pct = progress
+                    self.signals.progress.emit(progress)
+
             # Upload file with progress tracking
             file_id = self.drive_manager.upload_file(
                 str(self.file_path),
@@ -67,12 +132,12 @@ class UploadWorker(QThread):
             )
             
             if file_id:
-                self.progress.emit(100)
-                self.finished.emit(True, "Upload completed successfully")
+                self.signals.progress.emit(100)
+                self.signals.finished.emit(True, "Upload completed successfully")
             else:
-                self.finished.emit(False, "Upload failed - no file ID returned")
+                self.signals.finished.emit(False, "Upload failed - no file ID returned")
         except Exception as e:
-            self.finished.emit(False, str(e))
+            self.signals.finished.emit(False, str(e))
 
 
 class UIConstants:
@@ -81,19 +146,81 @@ class UIConstants:
         "blue": {"normal": "#2196F3", "hover": "#1976D2"},
         "red": {"normal": "#f44336", "hover": "#d32f2f"}
     }
-    STYLES = {
-        "dropdown": """
-            QComboBox {
-                padding: 5px;
-                border: 1px solid #ccc;
-                border-radius: 3px;
-                min-width: 100px;
-            }
-            QComboBox:hover {
-                border: 1px solid #999;
-            }
-        """
-    }
+    # Selector-based rules keyed on the buttonStyle dynamic property;
+    # widgets opt in with setProperty instead of per-widget stylesheets
+    _BUTTON_QSS = """
+        QPushButton[buttonStyle="%(name)s"] {
+            background-color: %(normal)s;
+            color: white;
+            border: none;
+            padding: 10px 20px;
+            border-radius: 5px;
+            font-size: 16px;
+        }
+        QPushButton[buttonStyle="%(name)s"]:hover {
+            background-color: %(hover)s;
+        }
+        QPushButton[buttonStyle="%(name)s"]:disabled {
+            background-color: #BDBDBD;
+        }
+    """
+    # One application-wide stylesheet, assembled once at import; Qt
+    # parses it a single time instead of once per setStyleSheet call
+    APP_QSS = "".join(
+        _BUTTON_QSS % {"name": color, **palette}
+        for color, palette in BUTTON_COLORS.items()
+    ) + """
+        QPushButton[buttonStyle="add"] {
+            background-color: #2196F3;
+            color: white;
+            border: none;
+            border-radius: 3px;
+            font-size: 16px;
+            font-weight: bold;
+            padding-bottom: 4px;
+            margin: 0;
+            text-align: center;
+        }
+        QPushButton[buttonStyle="add"]:hover {
+            background-color: #1976D2;
+        }
+        QPushButton[buttonStyle="add"]:pressed {
+            background-color: #1565C0;
+        }
+        QPushButton[buttonStyle="add"]:disabled {
+            background-color: #BDBDBD;
+            color: #757575;
+        }
+        QComboBox {
+            padding: 5px;
+            border: 1px solid #ccc;
+            border-radius: 3px;
+            min-width: 100px;
+        }
+        QComboBox:hover {
+            border: 1px solid #999;
+        }
+        QLabel#welcomeLabel {
+            font-size: 24px;
+            margin: 20px;
+        }
+        QLabel#recordingTimeLabel {
+            font-size: 16px;
+            font-weight: bold;
+        }
+        QLabel[labelRole="field"] {
+            font-size: 14px;
+        }
+    """
+
+
+class ConnectionState(Enum):
+    """Lifecycle of the OBS WebSocket connection."""
+
+    DISCONNECTED = "disconnected"
+    CONNECTING = "connecting"
+    CONNECTED = "connected"
+    ERROR = "error"
 
 
 class MainWindow(QMainWindow):
@@ -104,50 +231,128 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.config = Config()
         self.selected_file: Optional[Path] = None
-        self.obs_manager = OBSManager()
-        
+        # Last file that passed validate_file; upload skips re-validating
+        # when it still matches the selection
+        self._validated_file: Optional[Path] = None
+        # Target filename for the recording in progress, if any
+        self.desired_filename: Optional[str] = None
+        # Next recording's filename/path, computed when the selection
+        # changes so the start click doesn't pay for it
+        self._precomputed_filename: Optional[str] = None
+        self._precomputed_path: Optional[Path] = None
+
+        # The OBS manager (and transitively the Google API client) is
+        # heavyweight to import and construct; it's created after the
+        # event loop starts so the window paints immediately
+        self.obs_manager = None
+        self.drive_manager = None
+        self.is_drive_configured = False
+
+        # Bound concurrent uploads; two in flight is plenty for this app
+        QThreadPool.globalInstance().setMaxThreadCount(2)
+
+        # Workers currently in flight, kept alive until they finish
+        self._active_workers: set = set()
+
+        # Cached record-button enablement; see _update_record_btn_state
+        self._record_btn_state = False
+
+        self.recording_timer = QTimer()
+        self.recording_timer.timeout.connect(self._update_recording_status)
+        # Monotonic clock for the elapsed-time display; immune to
+        # wall-clock adjustments and allocation-free per tick
+        self._elapsed = QElapsedTimer()
+        # Last rendered elapsed-time string; repeat ticks inside the same
+        # second skip the setText entirely
+        self._last_time_text = ""
+
+        # Watch the recording directory so the post-stop rename runs when
+        # the file actually lands instead of after a blocking sleep
+        self._fs_watch = QFileSystemWatcher([str(self.config.data_dir)], self)
+        self._fs_watch.directoryChanged.connect(self._on_recording_dir_changed)
+        self._awaiting_rename = False
+        self._pending_recording_path: Optional[str] = None
+        self.current_recording_path: Optional[Path] = None  # Store current recording path
+
+        # Auto-reconnect with bounded exponential backoff; the GUI heals
+        # itself when OBS comes back without the user clicking
+        self.connection_state = ConnectionState.DISCONNECTED
+        self._reconnect_delay_ms = 1000
+        self._reconnect_max_ms = 30000
+        self._failure_notified = False
+
+        # Timestamp of the last status-label repaint during uploads
+        self._last_status_ts = 0.0
+
+        # Candidate recording directories, assembled once; the scandir in
+        # search_for_recordings charges a missing path one syscall, so no
+        # exists() filtering is needed here or per search
+        self._search_dirs = (self.config.data_dir, *_OBS_DEFAULT_DIRS)
+
+        # Set once ensure_directories has seen the data dir exist, so
+        # later calls skip the mkdir syscall entirely
+        self._data_dir_verified = False
+
+        self.setup_ui()
+        self.setup_icon()
+        self.status_label.setText("Initializing...")
+        # The precomputed filename embeds the date; refresh it at midnight
+        self._schedule_date_rollover()
+        # Create the backends and connect to OBS once the event loop is
+        # running; neither blocks the first frame
+        QTimer.singleShot(0, self._init_backends)
+
+    def _init_backends(self) -> None:
+        """Create the OBS and Drive managers after the UI is up."""
+        from src.core.obs_manager import OBSManager
+
+        # Single attempt per connect: retries belong to the backoff timer
+        # in _handle_obs_connection_failure, and connect() runs on this
+        # thread, so in-connect backoff sleeps would freeze the UI
+        self.obs_manager = OBSManager(max_connect_attempts=1)
+
         # Initialize Google Drive manager
         try:
             self.drive_manager = self.obs_manager.drive_manager
             self.is_drive_configured = True
         except Exception as e:
-            logger.warning(f"Failed to initialize Google Drive manager: {e}")
+            logger.warning("Failed to initialize Google Drive manager: %s", e)
             self.is_drive_configured = False
-        
-        self.recording_timer = QTimer()
-        self.recording_timer.timeout.connect(self._update_recording_status)
-        self.current_recording_path: Optional[Path] = None  # Store current recording path
-        self.setup_ui()
-        self.setup_icon()
-        # Try to connect to OBS but don't block UI if it fails
-        QTimer.singleShot(0, self.connect_obs)
+
+        self.status_label.setText("")
+        self.connect_obs()
     
     def connect_obs(self) -> None:
         """Connect to OBS WebSocket server."""
+        if self.connection_state == ConnectionState.CONNECTED:
+            # A stale backoff timer fired after a successful (re)connect
+            return
+        self.connection_state = ConnectionState.CONNECTING
         try:
             if self.obs_manager.connect():
-                # If connected to OBS, assume recording is available
-                self.show_info("Connected to OBS. Ready for recording.")
-                
+                self.connection_state = ConnectionState.CONNECTED
+                self._reconnect_delay_ms = 1000
+                if not self._failure_notified:
+                    # If connected to OBS, assume recording is available
+                    self.show_info("Connected to OBS. Ready for recording.")
+                self._failure_notified = False
+
                 # Enable recording button if class and chapter are selected
-                self.record_btn.setEnabled(
-                    self.class_dropdown.currentText() != "Select Class" and 
-                    self.chapter_dropdown.currentText() != "Select Chapter"
-                )
+                self._update_record_btn_state()
                 self.record_btn.setToolTip("Start recording with OBS")
                 self.reconnect_btn.setText("Reconnect to OBS")
                 self.reconnect_btn.setEnabled(True)
             else:
                 self._handle_obs_connection_failure()
         except Exception as e:
-            logger.error(f"Error connecting to OBS: {e}", exc_info=True)
+            logger.error("Error connecting to OBS: %s", e, exc_info=True)
             self._handle_obs_connection_failure()
     
     def setup_icon(self) -> None:
         """Setup the application icon."""
-        icon_path = get_icon_path()
-        if icon_path:
-            self.setWindowIcon(QIcon(str(icon_path)))
+        icon = get_app_icon()
+        if icon:
+            self.setWindowIcon(icon)
     
     def setup_ui(self) -> None:
         """Setup the UI components."""
@@ -169,7 +374,7 @@ class MainWindow(QMainWindow):
         # Add welcome label
         welcome_label = QLabel(f"Welcome to {self.config.app_name}")
         welcome_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        welcome_label.setStyleSheet("font-size: 24px; margin: 20px;")
+        welcome_label.setObjectName("welcomeLabel")
         content_layout.addWidget(welcome_label)
         content_layout.addSpacing(20)  # Add spacing after welcome label
         
@@ -178,18 +383,18 @@ class MainWindow(QMainWindow):
         recording_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)  # Center horizontally
         
         self.record_btn = QPushButton("Start Recording")
-        self.record_btn.setStyleSheet(self._get_button_style("red"))
+        self.record_btn.setProperty("buttonStyle", "red")
         self.record_btn.setEnabled(False)
         self.record_btn.clicked.connect(self.toggle_recording)
         recording_layout.addWidget(self.record_btn)
         
         self.recording_time_label = QLabel("00:00:00")
-        self.recording_time_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        self.recording_time_label.setObjectName("recordingTimeLabel")
         self.recording_time_label.setVisible(False)
         recording_layout.addWidget(self.recording_time_label)
         
         self.reconnect_btn = QPushButton("Connect to OBS")
-        self.reconnect_btn.setStyleSheet(self._get_button_style("blue"))
+        self.reconnect_btn.setProperty("buttonStyle", "blue")
         self.reconnect_btn.clicked.connect(self.reconnect_obs)
         recording_layout.addWidget(self.reconnect_btn)
         
@@ -200,46 +405,18 @@ class MainWindow(QMainWindow):
         selection_layout = QHBoxLayout()
         selection_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)  # Center horizontally
         
-        # Define the button style with disabled state
-        add_button_style = """
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                font-size: 16px;
-                font-weight: bold;
-                padding-bottom: 4px;
-                margin: 0;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:pressed {
-                background-color: #1565C0;
-            }
-            QPushButton:disabled {
-                background-color: #BDBDBD;
-                color: #757575;
-            }
-        """
 
         # Class dropdown and add button
         class_label = QLabel("Class:")
-        class_label.setStyleSheet("font-size: 14px;")
+        class_label.setProperty("labelRole", "field")
         selection_layout.addWidget(class_label)
         
         self.class_dropdown = QComboBox()
-        self.class_dropdown.addItem("Select Class")
-        self.class_dropdown.addItems(self.config.get_classes())
-        self.class_dropdown.setStyleSheet(UIConstants.STYLES["dropdown"])
-        self.class_dropdown.currentTextChanged.connect(self._on_class_changed)
         selection_layout.addWidget(self.class_dropdown)
         
         add_class_btn = QPushButton("+")
         add_class_btn.setFixedSize(30, 30)
-        add_class_btn.setStyleSheet(add_button_style)
+        add_class_btn.setProperty("buttonStyle", "add")
         add_class_btn.clicked.connect(self._add_new_class)
         selection_layout.addWidget(add_class_btn)
         
@@ -248,20 +425,17 @@ class MainWindow(QMainWindow):
         
         # Chapter dropdown and add button
         chapter_label = QLabel("Chapter:")
-        chapter_label.setStyleSheet("font-size: 14px;")
+        chapter_label.setProperty("labelRole", "field")
         selection_layout.addWidget(chapter_label)
         
         self.chapter_dropdown = QComboBox()
-        self.chapter_dropdown.addItem("Select Chapter")
-        self.chapter_dropdown.setStyleSheet(UIConstants.STYLES["dropdown"])
         self.chapter_dropdown.setEnabled(False)
-        self.chapter_dropdown.currentTextChanged.connect(self._on_chapter_changed)
         selection_layout.addWidget(self.chapter_dropdown)
         
         # Make add_chapter_btn a class instance variable
         self.add_chapter_btn = QPushButton("+")
         self.add_chapter_btn.setFixedSize(30, 30)
-        self.add_chapter_btn.setStyleSheet(add_button_style)
+        self.add_chapter_btn.setProperty("buttonStyle", "add")
         self.add_chapter_btn.clicked.connect(self._add_new_chapter)
         self.add_chapter_btn.setEnabled(False)
         selection_layout.addWidget(self.add_chapter_btn)
@@ -271,24 +445,35 @@ class MainWindow(QMainWindow):
         
         # Subtopic dropdown and add button
         subtopic_label = QLabel("Subtopic:")
-        subtopic_label.setStyleSheet("font-size: 14px;")
+        subtopic_label.setProperty("labelRole", "field")
         selection_layout.addWidget(subtopic_label)
         
         self.subtopic_dropdown = QComboBox()
-        self.subtopic_dropdown.addItem("Main")
-        self.subtopic_dropdown.setStyleSheet(UIConstants.STYLES["dropdown"])
         self.subtopic_dropdown.setEnabled(False)
-        self.subtopic_dropdown.currentTextChanged.connect(self._on_subtopic_changed)
         selection_layout.addWidget(self.subtopic_dropdown)
         
         # Make add_subtopic_btn a class instance variable
         self.add_subtopic_btn = QPushButton("+")
         self.add_subtopic_btn.setFixedSize(30, 30)
-        self.add_subtopic_btn.setStyleSheet(add_button_style)
+        self.add_subtopic_btn.setProperty("buttonStyle", "add")
         self.add_subtopic_btn.clicked.connect(self._add_new_subtopic)
         self.add_subtopic_btn.setEnabled(False)
         selection_layout.addWidget(self.add_subtopic_btn)
-        
+
+        # All three combos share one item tree; parent changes re-root the
+        # dependent combos instead of rebuilding their item lists
+        self._selection_model = self._build_selection_model()
+        with QSignalBlocker(self.class_dropdown), \
+                QSignalBlocker(self.chapter_dropdown), \
+                QSignalBlocker(self.subtopic_dropdown):
+            self.class_dropdown.setModel(self._selection_model)
+            self.chapter_dropdown.setModel(self._selection_model)
+            self.subtopic_dropdown.setModel(self._selection_model)
+            self._reroot_dependent_dropdowns()
+        self.class_dropdown.currentTextChanged.connect(self._on_class_changed)
+        self.chapter_dropdown.currentTextChanged.connect(self._on_chapter_changed)
+        self.subtopic_dropdown.currentTextChanged.connect(self._on_subtopic_changed)
+
         content_layout.addLayout(selection_layout)
         content_layout.addSpacing(30)  # Add spacing after class/chapter/subtopic selection
         
@@ -307,7 +492,7 @@ class MainWindow(QMainWindow):
         
         # Add upload button
         self.upload_btn = QPushButton("Upload Recording")
-        self.upload_btn.setStyleSheet(self._get_button_style("blue"))
+        self.upload_btn.setProperty("buttonStyle", "blue")
         self.upload_btn.setEnabled(False)
         self.upload_btn.clicked.connect(self.upload_file)
         self.upload_btn.setFixedWidth(200)  # Set fixed width for upload button
@@ -322,108 +507,151 @@ class MainWindow(QMainWindow):
         # Add the content widget to the main layout
         layout.addWidget(content_widget, alignment=Qt.AlignmentFlag.AlignHCenter)  # Center horizontally only
     
+    def _build_selection_model(self) -> QStandardItemModel:
+        """Build the shared class/chapter/subtopic item tree."""
+        model = QStandardItemModel(self)
+        model.appendRow(self._make_placeholder_class_item("Select Class"))
+        for cls in self.config.get_classes():
+            model.appendRow(self._make_class_item(cls))
+        return model
+
+    def _make_placeholder_class_item(self, label: str) -> QStandardItem:
+        """Create a class-level item carrying only the placeholder chain."""
+        item = QStandardItem(label)
+        placeholder_chapter = QStandardItem("Select Chapter")
+        placeholder_chapter.appendRow(QStandardItem("Main"))
+        item.appendRow(placeholder_chapter)
+        return item
+
+    def _make_class_item(self, class_name: str) -> QStandardItem:
+        """Create the item subtree for one class from config."""
+        item = self._make_placeholder_class_item(class_name)
+        for chapter in self.config.get_chapters(class_name):
+            chapter_item = QStandardItem(chapter)
+            for subtopic in self.config.get_subtopics(class_name, chapter):
+                chapter_item.appendRow(QStandardItem(subtopic))
+            item.appendRow(chapter_item)
+        return item
+
+    def _reroot_dependent_dropdowns(self) -> None:
+        """Point the chapter and subtopic combos at the selected class.
+
+        Re-rooting is O(1) against the shared model; no items are
+        destroyed or rebuilt. Callers block signals as needed.
+        """
+        model = self._selection_model
+        class_index = model.index(self.class_dropdown.currentIndex(), 0)
+        self.chapter_dropdown.setRootModelIndex(class_index)
+        self.chapter_dropdown.setCurrentIndex(0)
+        self.subtopic_dropdown.setRootModelIndex(model.index(0, 0, class_index))
+        self.subtopic_dropdown.setCurrentIndex(0)
+
     def _on_class_changed(self, class_name: str) -> None:
         """Handle class selection change."""
+        with QSignalBlocker(self.chapter_dropdown), QSignalBlocker(self.subtopic_dropdown):
+            self._reroot_dependent_dropdowns()
+
         if class_name == "Select Class":
-            self.chapter_dropdown.clear()
-            self.chapter_dropdown.addItem("Select Chapter")
             self.chapter_dropdown.setEnabled(False)
             self.add_chapter_btn.setEnabled(False)
-            self.subtopic_dropdown.clear()
-            self.subtopic_dropdown.addItem("Main")
             self.subtopic_dropdown.setEnabled(False)
             self.add_subtopic_btn.setEnabled(False)
+            self._update_record_btn_state()
             return
-        
-        # Update chapter dropdown
-        self.chapter_dropdown.clear()
-        self.chapter_dropdown.addItem("Select Chapter")
-        self.chapter_dropdown.addItems(self.config.get_chapters(class_name))
+
         self.chapter_dropdown.setEnabled(True)
         self.add_chapter_btn.setEnabled(True)
-        
-        # Reset subtopic dropdown
-        self.subtopic_dropdown.clear()
-        self.subtopic_dropdown.addItem("Main")
         self.subtopic_dropdown.setEnabled(False)
         self.add_subtopic_btn.setEnabled(False)
-        
-        # Update recording button state
-        self.record_btn.setEnabled(
-            self.chapter_dropdown.currentText() != "Select Chapter"
-        )
-        
+
         # Reset file selection
         self.selected_file = None
+        self._validated_file = None
         self.file_label.setText("No recording available")
         self.upload_btn.setEnabled(False)
-        
-        # Update recording button state only if OBS is connected
-        if self.obs_manager.is_connected:
-            self.record_btn.setEnabled(
-                class_name != "Select Class" and 
-                self.chapter_dropdown.currentText() != "Select Chapter"
-            )
-    
+
+        self._update_record_btn_state()
+        self._recompute_recording_target()
+
     def _on_chapter_changed(self, chapter_name: str) -> None:
         """Handle chapter selection change."""
+        model = self._selection_model
+        class_index = model.index(self.class_dropdown.currentIndex(), 0)
+        chapter_index = model.index(self.chapter_dropdown.currentIndex(), 0, class_index)
+        with QSignalBlocker(self.subtopic_dropdown):
+            self.subtopic_dropdown.setRootModelIndex(chapter_index)
+            self.subtopic_dropdown.setCurrentIndex(0)
+
         if chapter_name == "Select Chapter":
-            self.subtopic_dropdown.clear()
-            self.subtopic_dropdown.addItem("Main")
             self.subtopic_dropdown.setEnabled(False)
             self.add_subtopic_btn.setEnabled(False)
+            self._update_record_btn_state()
+            self._recompute_recording_target()
             return
-        
-        # Update subtopic dropdown
-        class_name = self.class_dropdown.currentText()
-        self.subtopic_dropdown.clear()
-        self.subtopic_dropdown.addItems(self.config.get_subtopics(class_name, chapter_name))
+
         self.subtopic_dropdown.setEnabled(True)
         self.add_subtopic_btn.setEnabled(True)
-        
-        # Update recording button state
-        self.record_btn.setEnabled(True)
-    
+
+        self._update_record_btn_state()
+        self._recompute_recording_target()
+
     def _on_subtopic_changed(self, subtopic_name: str) -> None:
         """Handle subtopic selection change."""
-        # Update recording button state
-        self.record_btn.setEnabled(
-            self.chapter_dropdown.currentText() != "Select Chapter"
+        self._update_record_btn_state()
+        self._recompute_recording_target()
+
+    def _recompute_recording_target(self) -> None:
+        """Precompute the next recording's filename and path.
+
+        Runs on selection changes (and the date rollover) so the start
+        click only has to hand the cached path to OBS.
+        """
+        class_name = self.class_dropdown.currentText()
+        chapter_name = self.chapter_dropdown.currentText()
+        if class_name == "Select Class" or chapter_name == "Select Chapter":
+            self._precomputed_filename = None
+            self._precomputed_path = None
+            return
+
+        subtopic_name = self.subtopic_dropdown.currentText()
+        date_format = _today_str()
+        # Filename format: ${class}_${chapter}_${subtopic}_${DD-MM-YYYY}
+        filename = (
+            f"{_sanitize(class_name)}_{_sanitize(chapter_name)}_"
+            f"{_sanitize(subtopic_name)}_{date_format}.mp4"
         )
-    
-    def _get_button_style(self, color: str) -> str:
-        """Get button style based on color."""
-        colors = {
-            "green": {
-                "normal": "#4CAF50",
-                "hover": "#45a049",
-            },
-            "blue": {
-                "normal": "#2196F3",
-                "hover": "#1976D2",
-            },
-            "red": {
-                "normal": "#f44336",
-                "hover": "#d32f2f",
-            },
-        }
-        return f"""
-            QPushButton {{
-                background-color: {colors[color]['normal']};
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-size: 16px;
-            }}
-            QPushButton:hover {{
-                background-color: {colors[color]['hover']};
-            }}
-            QPushButton:disabled {{
-                background-color: #BDBDBD;
-            }}
+        self._precomputed_filename = filename
+        self._precomputed_path = self.config.data_dir / filename
+
+    def _schedule_date_rollover(self) -> None:
+        """Arm a one-shot timer for just past the next midnight."""
+        now = datetime.now()
+        midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=1, microsecond=0)
+        QTimer.singleShot(int((midnight - now).total_seconds() * 1000), self._on_date_rollover)
+
+    def _on_date_rollover(self) -> None:
+        """Refresh the date-bearing precomputed filename and re-arm."""
+        self._recompute_recording_target()
+        self._schedule_date_rollover()
+
+    def _update_record_btn_state(self) -> None:
+        """Recompute record-button enablement, touching Qt only on change.
+
+        Centralizes the connected-plus-valid-selection rule the slot
+        handlers used to each recompute; skipping the redundant
+        setEnabled avoids needless style repolish and repaints.
         """
+        new_state = (
+            self.obs_manager is not None
+            and self.obs_manager.is_connected
+            and self.class_dropdown.currentText() != "Select Class"
+            and self.chapter_dropdown.currentText() != "Select Chapter"
+        )
+        if self._record_btn_state != new_state:
+            self._record_btn_state = new_state
+            self.record_btn.setEnabled(new_state)
     
+
     def select_file(self) -> None:
         """Handle file selection."""
         if self.class_dropdown.currentText() == "Select Class":
@@ -446,6 +674,7 @@ class MainWindow(QMainWindow):
             
             if is_valid:
                 self.selected_file = file_path
+                self._validated_file = file_path
                 self.file_label.setText(f"Selected: {file_path.name}")
                 self.upload_btn.setEnabled(True)
                 self.status_label.setText("")
@@ -458,11 +687,13 @@ class MainWindow(QMainWindow):
             self.show_error("No file selected")
             return
         
-        # Validate file
-        is_valid, error_msg = self.config.validate_file(self.selected_file)
-        if not is_valid:
-            self.show_error(error_msg)
-            return
+        # Validate file, unless the current selection already passed
+        if self._validated_file != self.selected_file:
+            is_valid, error_msg = self.config.validate_file(self.selected_file)
+            if not is_valid:
+                self.show_error(error_msg)
+                return
+            self._validated_file = self.selected_file
         
         # Get current year
         current_year = datetime.now().strftime("%Y")
@@ -482,7 +713,7 @@ class MainWindow(QMainWindow):
         self.upload_btn.setEnabled(False)
         
         # Create and start upload worker
-        self.upload_worker = UploadWorker(
+        worker = UploadWorker(
             self.selected_file,
             self.drive_manager,
             class_name,
@@ -490,14 +721,22 @@ class MainWindow(QMainWindow):
             current_year,
             subtopic_name
         )
-        self.upload_worker.progress.connect(self._update_progress)
-        self.upload_worker.finished.connect(self._upload_finished)
-        self.upload_worker.start()
+        worker.signals.progress.connect(self._update_progress)
+        worker.signals.finished.connect(self._upload_finished)
+        # Hold a reference for the duration of the run; a plain attribute
+        # would drop the previous worker as soon as another upload starts
+        self._active_workers.add(worker)
+        worker.signals.finished.connect(lambda *_, w=worker: self._active_workers.discard(w))
+        QThreadPool.globalInstance().start(worker)
     
     def _update_progress(self, value: int) -> None:
         """Update upload progress."""
         self.progress_bar.setValue(value)
-        self.status_label.setText(f"Uploading... {value}%")
+        # Throttle label relayouts to ~10 Hz; the bar itself is cheap
+        now = time.monotonic()
+        if now - self._last_status_ts > 0.1 or value >= 100:
+            self._last_status_ts = now
+            self.status_label.setText(f"Uploading... {value}%")
     
     def _upload_finished(self, success: bool, message: str) -> None:
         """Handle upload completion."""
@@ -509,26 +748,27 @@ class MainWindow(QMainWindow):
             self.status_label.setText("Upload completed successfully")
             
             # Reset the application state
-            # Reset dropdowns
-            self.class_dropdown.setCurrentText("Select Class")
-            self.chapter_dropdown.clear()
-            self.chapter_dropdown.addItem("Select Chapter")
+            # Reset dropdowns silently; the explicit resets below cover
+            # everything the change handlers would have done
+            with QSignalBlocker(self.class_dropdown), \
+                    QSignalBlocker(self.chapter_dropdown), \
+                    QSignalBlocker(self.subtopic_dropdown):
+                self.class_dropdown.setCurrentIndex(0)
+                self._reroot_dependent_dropdowns()
             self.chapter_dropdown.setEnabled(False)
-            self.subtopic_dropdown.clear()
-            self.subtopic_dropdown.addItem("Main")
             self.subtopic_dropdown.setEnabled(False)
-            
+
             # Reset buttons
             self.add_chapter_btn.setEnabled(False)
             self.add_subtopic_btn.setEnabled(False)
             
             # Reset file selection
             self.selected_file = None
+            self._validated_file = None
             self.file_label.setText("No recording available")
-            
-            # Reset recording button if OBS is connected
-            if self.obs_manager.is_connected:
-                self.record_btn.setEnabled(False)
+
+            # The dropdown reset above invalidates the selection
+            self._update_record_btn_state()
         else:
             self.show_error(f"Upload failed: {message}")
             self.status_label.setText("Upload failed")
@@ -536,7 +776,7 @@ class MainWindow(QMainWindow):
     
     def toggle_recording(self) -> None:
         """Toggle recording state."""
-        if not self.obs_manager.is_connected:
+        if self.obs_manager is None or not self.obs_manager.is_connected:
             self.show_error("OBS is not connected. Please connect to OBS first.")
             return
 
@@ -553,6 +793,7 @@ class MainWindow(QMainWindow):
             # Reset application state before starting new recording
             # Reset file selection
             self.selected_file = None
+            self._validated_file = None
             self.file_label.setText("No recording available")
             self.upload_btn.setEnabled(False)
             
@@ -562,32 +803,28 @@ class MainWindow(QMainWindow):
             # Hide progress bar if visible
             self.progress_bar.setVisible(False)
             
-            # Create filename with date in DD-MM-YYYY format
-            date_format = datetime.now().strftime("%d-%m-%Y")
-            
-            # Remove any special characters from chapter name that might cause issues in filenames
-            safe_chapter_name = "".join(c for c in chapter_name if c.isalnum() or c in (' ', '-', '_'))
-            safe_class_name = "".join(c for c in class_name if c.isalnum() or c in (' ', '-', '_'))
-            safe_subtopic_name = "".join(c for c in subtopic_name if c.isalnum() or c in (' ', '-', '_'))
-            
-            # Create filename in the requested format: ${class}_${chapter}_${subtopic}_${DD-MM-YYYY}
-            filename = f"{safe_class_name}_{safe_chapter_name}_{safe_subtopic_name}_{date_format}.mp4"
-            self.current_recording_path = self.config.data_dir / filename
-            
+            # The filename was precomputed when the selection settled;
+            # recompute only if a stale state slipped through
+            if self._precomputed_path is None:
+                self._recompute_recording_target()
+            filename = self._precomputed_filename
+            self.current_recording_path = self._precomputed_path
+
             # Store the desired filename for later use when renaming
             self.desired_filename = filename
-            
-            logger.info(f"Attempting to start recording. File will be saved to: {self.current_recording_path}")
-            logger.info(f"Data directory: {self.config.data_dir}")
-            logger.info(f"Base directory: {self.config.base_dir}")
+
+            logger.info(
+                "Attempting to start recording. File: %s (data dir: %s, base dir: %s)",
+                self.current_recording_path, self.config.data_dir, self.config.base_dir
+            )
             
             if self.obs_manager.start_recording(self.current_recording_path):
                 self.record_btn.setText("Stop Recording")
                 self.recording_time_label.setVisible(True)
                 self.recording_timer.start(1000)  # Update every second
-                self.recording_start_time = datetime.now()
+                self._elapsed.start()
                 self.reconnect_btn.setEnabled(False)  # Disable reconnect during recording
-                self.show_info(f"Recording started. Will be saved as: {filename}")
+                self._notify(f"Recording started. Will be saved as: {filename}")
             else:
                 self.show_error(
                     "Failed to start recording. Please check:\n\n"
@@ -606,26 +843,21 @@ class MainWindow(QMainWindow):
                 self.recording_time_label.setVisible(False)
                 self.recording_timer.stop()
                 self.reconnect_btn.setEnabled(True)
-                
-                # Wait a bit longer for the file to be saved
-                time.sleep(2)
-                
+
                 # Get the actual file path from OBS
                 actual_recording_path = self.obs_manager.last_recording_path
-                
-                # If we have both the actual path and the desired filename, rename the file
-                if actual_recording_path and hasattr(self, 'desired_filename'):
-                    self.rename_recording_file(actual_recording_path)
-                    # Only enable upload if Google Drive is configured
-                    if self.is_drive_configured:
-                        self.upload_btn.setEnabled(True)
-                    else:
-                        self.show_warning(
-                            "Recording saved successfully, but Google Drive is not configured.\n\n"
-                            "To enable uploading:\n"
-                            "1. Configure Google Drive credentials in the settings\n"
-                            "2. Restart the application"
-                        )
+
+                # If we have both the actual path and the desired filename,
+                # finish up once the file lands on disk. The directory
+                # watcher fires as OBS finalizes the file; the one-shot
+                # timer is a fallback in case no filesystem event arrives.
+                if actual_recording_path and self.desired_filename:
+                    self._pending_recording_path = actual_recording_path
+                    self._awaiting_rename = True
+                    watch_dir = str(Path(actual_recording_path).parent)
+                    if watch_dir not in self._fs_watch.directories():
+                        self._fs_watch.addPath(watch_dir)
+                    QTimer.singleShot(2000, self._finalize_recording)
                 else:
                     # Look for recently created video files
                     self.search_for_recordings()
@@ -638,6 +870,33 @@ class MainWindow(QMainWindow):
                 self.reconnect_btn.setEnabled(True)
                 self.search_for_recordings()
 
+    def _on_recording_dir_changed(self, path: str) -> None:
+        """React to filesystem activity in a watched recording directory."""
+        if self._awaiting_rename:
+            # Debounce: OBS writes the file in two phases, so give it a
+            # moment to settle before renaming
+            QTimer.singleShot(200, self._finalize_recording)
+
+    def _finalize_recording(self) -> None:
+        """Rename the finished recording and enable upload, exactly once."""
+        if not self._awaiting_rename:
+            return
+        self._awaiting_rename = False
+        actual_recording_path = self._pending_recording_path
+        self._pending_recording_path = None
+
+        self.rename_recording_file(actual_recording_path)
+        # Only enable upload if Google Drive is configured
+        if self.is_drive_configured:
+            self.upload_btn.setEnabled(True)
+        else:
+            self.show_warning(
+                "Recording saved successfully, but Google Drive is not configured.\n\n"
+                "To enable uploading:\n"
+                "1. Configure Google Drive credentials in the settings\n"
+                "2. Restart the application"
+            )
+
     def rename_recording_file(self, actual_path: str) -> None:
         """Rename the recording file to use our desired format.
         
@@ -645,7 +904,7 @@ class MainWindow(QMainWindow):
             actual_path: The actual path where OBS saved the recording
         """
         try:
-            logger.info(f"Renaming recording file from: {actual_path}")
+            logger.info("Renaming recording file from: %s", actual_path)
             
             # Convert string path to Path object if it's not already
             if isinstance(actual_path, str):
@@ -653,30 +912,37 @@ class MainWindow(QMainWindow):
                 
             # Ensure the file exists
             if not actual_path.exists():
-                logger.warning(f"Cannot rename file - source does not exist: {actual_path}")
+                logger.warning("Cannot rename file - source does not exist: %s", actual_path)
                 self.search_for_recordings()
                 return
                 
             # Get the parent directory to save the renamed file in the same location
             target_dir = actual_path.parent
-            
-            # Create the target path with our desired filename
-            target_path = target_dir / self.desired_filename
-            
-            logger.info(f"Renaming to: {target_path}")
-            
-            # If target file already exists, add a numeric suffix
-            counter = 1
-            while target_path.exists():
-                name_parts = self.desired_filename.rsplit('.', 1)
-                if len(name_parts) > 1:
-                    target_path = target_dir / f"{name_parts[0]}_{counter}.{name_parts[1]}"
+
+            # One directory read replaces a stat per collision probe
+            with os.scandir(target_dir) as entries:
+                existing = {entry.name for entry in entries}
+
+            if self.desired_filename not in existing:
+                target_path = target_dir / self.desired_filename
+            else:
+                # Pick the first free numeric suffix against the snapshot
+                stem, dot, ext = self.desired_filename.rpartition('.')
+                counter = 1
+                if dot:
+                    while f"{stem}_{counter}.{ext}" in existing:
+                        counter += 1
+                    target_path = target_dir / f"{stem}_{counter}.{ext}"
                 else:
+                    while f"{self.desired_filename}_{counter}" in existing:
+                        counter += 1
                     target_path = target_dir / f"{self.desired_filename}_{counter}"
-                counter += 1
-                
-            # Rename the file
-            actual_path.rename(target_path)
+
+            logger.info("Renaming to: %s", target_path)
+
+            # Rename the file; replace() also succeeds on Windows if the
+            # target appeared between the snapshot and the rename
+            actual_path.replace(target_path)
             
             # Update current_recording_path to the new path
             self.current_recording_path = target_path
@@ -686,14 +952,14 @@ class MainWindow(QMainWindow):
             if self.is_drive_configured:
                 self.upload_btn.setEnabled(True)
             
-            logger.info(f"Successfully renamed recording to: {target_path}")
-            self.show_info(f"Recording saved as: {target_path.name}")
+            logger.info("Successfully renamed recording to: %s", target_path)
+            self._notify(f"Recording saved as: {target_path.name}")
             self.file_label.setText(f"Recording: {target_path.name}")
             
         except Exception as e:
-            logger.error(f"Failed to rename recording file: {e}", exc_info=True)
+            logger.error("Failed to rename recording file: %s", e, exc_info=True)
             # If rename fails, show the original path
-            self.show_info(f"Recording saved to: {actual_path}")
+            self._notify(f"Recording saved to: {actual_path}")
             # Try searching for recordings as a fallback
             self.search_for_recordings()
 
@@ -701,40 +967,43 @@ class MainWindow(QMainWindow):
         """Search for recent recordings in various locations."""
         # Try to find recent mp4 files in several possible locations
         try:
-            # First check the videos directory
-            video_files = list(self.config.data_dir.glob("*.mp4"))
-            
-            # Also check OBS default directory which might be different
-            default_obs_paths = [
-                Path.home() / "Videos",
-                Path("C:/Users") / Path.home().name / "Videos",
-                Path.cwd() / "recordings",
-                Path("C:/Program Files/obs-studio"),
-                Path("C:/Program Files (x86)/obs-studio")
-            ]
-            
-            for path in default_obs_paths:
-                if path.exists():
-                    video_files.extend(list(path.glob("*.mp4")))
-            
-            # Sort by modification time to get the most recent
-            if video_files:
-                video_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-                
+            # One scandir pass per directory, tracking only the newest
+            # match; DirEntry.stat() is cached so each file costs a single
+            # stat instead of glob-then-sort-then-filter
+            newest = None
+            for path in self._search_dirs:
+                try:
+                    entries = os.scandir(path)
+                except OSError:
+                    continue
+                with entries:
+                    for entry in entries:
+                        # One C-level suffix check covers every container
+                        # OBS can be configured to record to
+                        if not entry.name.endswith(_VIDEO_SUFFIXES):
+                            continue
+                        try:
+                            mtime = entry.stat().st_mtime
+                        except OSError:
+                            continue
+                        if newest is None or mtime > newest[0]:
+                            newest = (mtime, entry.path)
+
+            if newest:
+                mtime, newest_path = newest
                 # Consider files modified in the last minute
-                recent_files = [f for f in video_files if (datetime.now().timestamp() - f.stat().st_mtime) < 60]
-                
-                if recent_files:
-                    self.show_info(f"Recording saved to: {recent_files[0]}")
-                    self.selected_file = recent_files[0]
-                    self.file_label.setText(f"Recording: {recent_files[0].name}")
+                if time.time() - mtime < 60:
+                    newest_file = Path(newest_path)
+                    self._notify(f"Recording saved to: {newest_file}")
+                    self.selected_file = newest_file
+                    self.file_label.setText(f"Recording: {newest_file.name}")
                     self.upload_btn.setEnabled(True)
                     return
-                
+
                 # If we found video files but none are recent, mention the most recent one
-                self.show_info(f"Recording may have been saved to: {video_files[0]}")
+                self._notify(f"Recording may have been saved to: {newest_path}")
                 return
-            
+
             # If we get here, no video files were found
             self.show_warning(
                 "Could not find the recording file.\n\n"
@@ -744,23 +1013,27 @@ class MainWindow(QMainWindow):
                 "3. Try recording again with different settings"
             )
         except Exception as e:
-            logger.error(f"Error searching for recordings: {e}", exc_info=True)
+            logger.error("Error searching for recordings: %s", e, exc_info=True)
             self.show_error("Could not locate recording file.")
     
     def _update_recording_status(self) -> None:
         """Update recording time display."""
-        if self.obs_manager.is_recording:
-            elapsed = datetime.now() - self.recording_start_time
-            hours = elapsed.seconds // 3600
-            minutes = (elapsed.seconds % 3600) // 60
-            seconds = elapsed.seconds % 60
-            self.recording_time_label.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+        if self.obs_manager is not None and self.obs_manager.is_recording:
+            h, rem = divmod(self._elapsed.elapsed() // 1000, 3600)
+            m, s = divmod(rem, 60)
+            text = f"{h:02d}:{m:02d}:{s:02d}"
+            # The string only changes once per second; don't repaint when
+            # the timer fires without it moving
+            if text != self._last_time_text:
+                self._last_time_text = text
+                self.recording_time_label.setText(text)
     
     def closeEvent(self, event) -> None:
         """Handle application close event."""
-        if self.obs_manager.is_recording:
-            self.obs_manager.stop_recording()
-        self.obs_manager.disconnect()
+        if self.obs_manager is not None:
+            if self.obs_manager.is_recording:
+                self.obs_manager.stop_recording()
+            self.obs_manager.disconnect()
         super().closeEvent(event)
 
     def validate_config(self) -> bool:
@@ -771,16 +1044,14 @@ class MainWindow(QMainWindow):
         return True
 
     def ensure_directories(self) -> None:
-        """Ensure required directories exist with retry."""
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                self.data_dir.mkdir(exist_ok=True)
-                return
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    raise
-                logger.warning(f"Failed to create directory: {e}")
+        """Ensure required directories exist."""
+        if self._data_dir_verified:
+            return
+        # exist_ok covers the only recoverable case; any other failure
+        # (permissions, read-only mount) would fail identically on a
+        # retry, so surface it immediately
+        self.config.data_dir.mkdir(parents=True, exist_ok=True)
+        self._data_dir_verified = True
 
     def show_error(self, message: str) -> None:
         """Show error message to user."""
@@ -792,20 +1063,39 @@ class MainWindow(QMainWindow):
         QMessageBox.information(self, "Info", message)
         logger.info(message)
 
+    def _notify(self, message: str) -> None:
+        """Show a passive status-bar message.
+
+        Unlike show_info this never blocks the event loop, so the
+        post-save pipeline (e.g. queuing an upload) proceeds without
+        waiting for the user to dismiss a dialog.
+        """
+        logger.info(message)
+        self.statusBar().showMessage(message, 10000)
+
     def _handle_obs_connection_failure(self) -> None:
-        """Handle OBS connection failure."""
-        self.record_btn.setEnabled(False)
-        self.record_btn.setToolTip("OBS not connected. Click 'Connect to OBS' to try again")
+        """Handle OBS connection failure and schedule a retry."""
+        self.connection_state = ConnectionState.ERROR
+        self._update_record_btn_state()
+        self.record_btn.setToolTip("OBS not connected. Retrying automatically")
         self.reconnect_btn.setText("Connect to OBS")
         self.reconnect_btn.setEnabled(True)
-        self.show_error(
-            "Failed to connect to OBS. Recording will be disabled.\n\n"
-            "To enable recording:\n"
-            "1. Start OBS\n"
-            "2. Go to Tools -> WebSocket Server Settings\n"
-            "3. Enable WebSocket server\n"
-            "4. Click 'Connect to OBS' button"
-        )
+
+        # Retry with exponential backoff, capped at 30s; only the first
+        # failure raises a dialog so background retries stay silent
+        QTimer.singleShot(self._reconnect_delay_ms, self.connect_obs)
+        self._reconnect_delay_ms = min(self._reconnect_delay_ms * 2, self._reconnect_max_ms)
+
+        if not self._failure_notified:
+            self._failure_notified = True
+            self.show_error(
+                "Failed to connect to OBS. Recording will be disabled.\n\n"
+                "To enable recording:\n"
+                "1. Start OBS\n"
+                "2. Go to Tools -> WebSocket Server Settings\n"
+                "3. Enable WebSocket server\n\n"
+                "The app will keep retrying in the background."
+            )
 
     def reconnect_obs(self) -> None:
         """Attempt to reconnect to OBS."""
@@ -817,12 +1107,18 @@ class MainWindow(QMainWindow):
     def _attempt_reconnect(self) -> None:
         """Attempt to reconnect to OBS in a non-blocking way."""
         try:
+            if self.obs_manager is None:
+                # Backends not built yet; _init_backends will connect
+                return
             # Ensure clean disconnect first
             self.obs_manager.disconnect()
+            self.connection_state = ConnectionState.DISCONNECTED
+            # Manual retry starts the backoff ladder over
+            self._reconnect_delay_ms = 1000
             # Try to connect
             self.connect_obs()
         except Exception as e:
-            logger.error(f"Error during reconnection: {e}", exc_info=True)
+            logger.error("Error during reconnection: %s", e, exc_info=True)
             self._handle_obs_connection_failure()
 
     def show_warning(self, message: str) -> None:
@@ -841,17 +1137,9 @@ class MainWindow(QMainWindow):
         
         if ok and class_name:
             if self.config.add_class(class_name):
-                # Update class dropdown
-                current_text = self.class_dropdown.currentText()
-                self.class_dropdown.clear()
-                self.class_dropdown.addItem("Select Class")
-                self.class_dropdown.addItems(self.config.get_classes())
-                
-                # Try to restore previous selection
-                index = self.class_dropdown.findText(current_text)
-                if index >= 0:
-                    self.class_dropdown.setCurrentIndex(index)
-                
+                # Append to the shared model; the current selection is
+                # untouched, so no restore dance is needed
+                self._selection_model.appendRow(self._make_class_item(class_name))
                 self.show_info(f"Added new class: {class_name}")
             else:
                 self.show_error(f"Class '{class_name}' already exists")
@@ -872,17 +1160,13 @@ class MainWindow(QMainWindow):
         
         if ok and chapter_name:
             if self.config.add_chapter(class_name, chapter_name):
-                # Update chapter dropdown
-                current_text = self.chapter_dropdown.currentText()
-                self.chapter_dropdown.clear()
-                self.chapter_dropdown.addItem("Select Chapter")
-                self.chapter_dropdown.addItems(self.config.get_chapters(class_name))
-                
-                # Try to restore previous selection
-                index = self.chapter_dropdown.findText(current_text)
-                if index >= 0:
-                    self.chapter_dropdown.setCurrentIndex(index)
-                
+                # Append the new chapter (with its config-provided
+                # subtopics) under the selected class item
+                class_item = self._selection_model.item(self.class_dropdown.currentIndex())
+                chapter_item = QStandardItem(chapter_name)
+                for subtopic in self.config.get_subtopics(class_name, chapter_name):
+                    chapter_item.appendRow(QStandardItem(subtopic))
+                class_item.appendRow(chapter_item)
                 self.show_info(f"Added new chapter: {chapter_name}")
             else:
                 self.show_error(f"Chapter '{chapter_name}' already exists in {class_name}")
@@ -904,9 +1188,11 @@ class MainWindow(QMainWindow):
         
         if ok and subtopic_name:
             if self.config.add_subtopic(class_name, chapter_name, subtopic_name):
-                # Update subtopic dropdown
-                self.subtopic_dropdown.clear()
-                self.subtopic_dropdown.addItems(self.config.get_subtopics(class_name, chapter_name))
+                # Append under the selected chapter item and select it
+                model = self._selection_model
+                class_index = model.index(self.class_dropdown.currentIndex(), 0)
+                chapter_index = model.index(self.chapter_dropdown.currentIndex(), 0, class_index)
+                model.itemFromIndex(chapter_index).appendRow(QStandardItem(subtopic_name))
                 self.subtopic_dropdown.setCurrentText(subtopic_name)
             else:
                 self.show_error("Failed to add subtopic. It may already exist.") 
\ No newline at end of file
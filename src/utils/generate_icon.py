@@ -16,31 +16,36 @@ def generate_icon():
     
     # Draw a white circle
     margin = 20
-    draw.ellipse([margin, margin, size - margin, size - margin], 
+    draw.ellipse((margin, margin, size - margin, size - margin),
                  fill=(255, 255, 255, 255))
-    
+
     # Draw an up arrow
     arrow_color = (33, 150, 243, 255)
     center_x = size // 2
     center_y = size // 2
     arrow_size = size // 3
-    
+
+    # Derived measurements, each computed once instead of inline at
+    # every use below
+    half_shaft_width = (size // 8) // 2
+    half_arrow = arrow_size // 2
+    half_shaft_height = half_arrow // 2
+    head_half_width = arrow_size // 3
+
     # Draw the arrow shaft
-    shaft_width = size // 8
-    shaft_height = arrow_size // 2
-    draw.rectangle([
-        center_x - shaft_width // 2,
-        center_y + shaft_height // 2,
-        center_x + shaft_width // 2,
-        center_y + arrow_size // 2
-    ], fill=arrow_color)
-    
+    draw.rectangle((
+        center_x - half_shaft_width,
+        center_y + half_shaft_height,
+        center_x + half_shaft_width,
+        center_y + half_arrow,
+    ), fill=arrow_color)
+
     # Draw the arrow head
-    points = [
-        (center_x, center_y - arrow_size // 2),  # Top point
-        (center_x - arrow_size // 3, center_y + shaft_height // 2),  # Left point
-        (center_x + arrow_size // 3, center_y + shaft_height // 2),  # Right point
-    ]
+    points = (
+        (center_x, center_y - half_arrow),  # Top point
+        (center_x - head_half_width, center_y + half_shaft_height),  # Left point
+        (center_x + head_half_width, center_y + half_shaft_height),  # Right point
+    )
     draw.polygon(points, fill=arrow_color)
     
     # Save the icon
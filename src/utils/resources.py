@@ -2,30 +2,72 @@
 Utility module for handling application resources.
 """
 
+import functools
 from pathlib import Path
 from typing import Optional
 
+# Resources directory, resolved once at import
+_RESOURCES_DIR = Path(__file__).parent.parent / "resources"
 
+# Cached icon-path lookup result; the sentinel distinguishes "not yet
+# checked" from "checked and missing"
+_UNCHECKED = object()
+_icon_path = _UNCHECKED
+
+
+@functools.lru_cache(maxsize=32)
 def get_resource_path(relative_path: str) -> Path:
     """
     Get the absolute path to a resource file.
-    
+
+    Results are cached, so repeated lookups of the same resource don't
+    rebuild the Path object.
+
     Args:
         relative_path: Path relative to the resources directory
-        
+
     Returns:
         Absolute path to the resource file
     """
-    base_path = Path(__file__).parent.parent / "resources"
-    return base_path / relative_path
+    return _RESOURCES_DIR / relative_path
 
 
 def get_icon_path() -> Optional[Path]:
     """
     Get the path to the application icon.
-    
+
+    The existence check runs once per process; later calls return the
+    cached answer without touching the filesystem.
+
     Returns:
         Path to the icon file if it exists, None otherwise
     """
-    icon_path = get_resource_path("icon.ico")
-    return icon_path if icon_path.exists() else None 
\ No newline at end of file
+    global _icon_path
+    if _icon_path is _UNCHECKED:
+        icon_path = get_resource_path("icon.ico")
+        _icon_path = icon_path if icon_path.exists() else None
+    return _icon_path
+
+
+# Decoded application icon, built at most once per process
+_APP_ICON = None
+
+
+def get_app_icon():
+    """
+    Get the application icon as a QIcon, decoding it at most once.
+
+    Every window that calls setWindowIcon gets the same QIcon instance,
+    so Qt reuses the decoded pixmaps instead of re-reading the file.
+
+    Returns:
+        Shared QIcon if the icon file exists, None otherwise
+    """
+    global _APP_ICON
+    if _APP_ICON is None:
+        from PyQt6.QtGui import QIcon
+
+        icon_path = get_icon_path()
+        if icon_path:
+            _APP_ICON = QIcon(str(icon_path))
+    return _APP_ICON
\ No newline at end of file
@@ -3,19 +3,44 @@ Test script for custom filename renaming functionality with OBS recordings.
 """
 
 import sys
+import threading
 import time
 import logging
 from pathlib import Path
 import obsws_python as obs
 from datetime import datetime
 import os
-import shutil
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, 
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+RECORD_STOPPED = 'OBS_WEBSOCKET_OUTPUT_STOPPED'
+
+
+def wait_for_file_flush(path, timeout=10.0):
+    """Wait until the file's size stabilizes across two consecutive reads.
+
+    Polls with exponential backoff (1 ms doubling to 500 ms) instead of a
+    fixed sleep, so the wait ends as soon as OBS finishes writing.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.001
+    last_size = -1
+    while time.monotonic() < deadline:
+        try:
+            size = path.stat().st_size
+        except OSError:
+            size = -1
+        if size >= 0 and size == last_size:
+            return True
+        last_size = size
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+    return False
+
+
 def test_rename_recording():
     """Test renaming of OBS recordings."""
     # Configuration
@@ -36,7 +61,18 @@ def test_rename_recording():
         logger.info(f"Connecting to OBS WebSocket server at {host}:{port}")
         client = obs.ReqClient(host=host, port=port, password=password)
         logger.info("Connected to OBS successfully")
-        
+
+        # Subscribe to record-state events so the stop wait is
+        # event-driven instead of a fixed sleep
+        record_stopped = threading.Event()
+
+        def on_record_state_changed(data):
+            if data.output_state == RECORD_STOPPED:
+                record_stopped.set()
+
+        events = obs.EventClient(host=host, port=port, password=password)
+        events.callback.register(on_record_state_changed)
+
         # Get OBS version
         version = client.get_version()
         logger.info(f"OBS Version: {version.obs_version}, WebSocket: {version.obs_web_socket_version}")
@@ -58,16 +94,21 @@ def test_rename_recording():
         if hasattr(result, 'output_path'):
             actual_path = result.output_path
             logger.info(f"Recording stopped. File saved to: {actual_path}")
-            
-            # Wait a bit for the file to be fully written
-            time.sleep(2)
-            
-            # Now rename the file
-            logger.info(f"Renaming file from: {actual_path}")
-            
+
+            # Block until OBS reports the record output fully stopped,
+            # then until the file's size stops moving
+            if not record_stopped.wait(timeout=10):
+                logger.warning("Timed out waiting for record-stopped event")
+
             # Convert to Path object
             actual_path = Path(actual_path)
-            
+
+            if not wait_for_file_flush(actual_path):
+                logger.warning(f"File size did not stabilize: {actual_path}")
+
+            # Now rename the file
+            logger.info(f"Renaming file from: {actual_path}")
+
             # Ensure the file exists
             if not actual_path.exists():
                 logger.error(f"Source file does not exist: {actual_path}")
@@ -75,42 +116,39 @@ def test_rename_recording():
                 
             # Get the parent directory
             target_dir = actual_path.parent
-            
-            # Create the target path
-            target_path = target_dir / desired_filename
-            
-            # If target already exists, create a copy instead
-            if target_path.exists():
-                logger.warning(f"Target file already exists: {target_path}")
+
+            # One directory read replaces a stat per collision probe
+            existing = set(os.listdir(target_dir))
+
+            if desired_filename not in existing:
+                target_path = target_dir / desired_filename
+            else:
+                logger.warning(f"Target file already exists: {target_dir / desired_filename}")
+                # Pick the first free numeric suffix against the snapshot
+                stem, dot, ext = desired_filename.rpartition('.')
                 counter = 1
-                while target_path.exists():
-                    name_parts = desired_filename.rsplit('.', 1)
-                    if len(name_parts) > 1:
-                        target_path = target_dir / f"{name_parts[0]}_{counter}.{name_parts[1]}"
-                    else:
-                        target_path = target_dir / f"{desired_filename}_{counter}"
-                    counter += 1
+                if dot:
+                    while f"{stem}_{counter}.{ext}" in existing:
+                        counter += 1
+                    target_path = target_dir / f"{stem}_{counter}.{ext}"
+                else:
+                    while f"{desired_filename}_{counter}" in existing:
+                        counter += 1
+                    target_path = target_dir / f"{desired_filename}_{counter}"
             
-            # Rename (or copy if rename fails)
+            # Rename with a single atomic os.replace; source and target
+            # share a parent directory, so there is no cross-device case
+            # and no need for the old read-the-whole-video copy fallback
             try:
                 logger.info(f"Renaming to: {target_path}")
-                actual_path.rename(target_path)
+                os.replace(actual_path, target_path)
                 logger.info(f"Successfully renamed file to: {target_path}")
-                
-                # Check if the new file exists and report its size
-                if target_path.exists():
-                    file_size = target_path.stat().st_size
-                    logger.info(f"New file size: {file_size} bytes")
-                else:
-                    logger.error("Rename seemed to succeed, but target file doesn't exist")
-            except Exception as rename_error:
+
+                # Report the renamed file's size
+                file_size = target_path.stat().st_size
+                logger.info(f"New file size: {file_size} bytes")
+            except OSError as rename_error:
                 logger.error(f"Failed to rename file: {rename_error}")
-                logger.info("Trying to copy instead...")
-                try:
-                    shutil.copy2(actual_path, target_path)
-                    logger.info(f"Successfully copied file to: {target_path}")
-                except Exception as copy_error:
-                    logger.error(f"Failed to copy file: {copy_error}")
         else:
             logger.warning("No output_path in result. Cannot rename file.")
         
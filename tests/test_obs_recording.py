@@ -4,6 +4,7 @@ This script connects to OBS, starts a recording for 10 seconds, and saves it in
 """
 
 import sys
+import threading
 import time
 import logging
 from pathlib import Path
@@ -14,6 +15,9 @@ logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+RECORD_STOPPED = 'OBS_WEBSOCKET_OUTPUT_STOPPED'
+
+
 def test_obs_recording():
     """Test OBS recording functionality - Direct implementation using obsws_python."""
     # Configuration
@@ -26,7 +30,18 @@ def test_obs_recording():
         logger.info(f"Connecting to OBS WebSocket server at {host}:{port}")
         client = obs.ReqClient(host=host, port=port, password=password)
         logger.info("Connected to OBS successfully")
-        
+
+        # Subscribe to record-state events so the post-stop wait is
+        # event-driven instead of hoping the file is already flushed
+        record_stopped = threading.Event()
+
+        def on_record_state_changed(data):
+            if data.output_state == RECORD_STOPPED:
+                record_stopped.set()
+
+        events = obs.EventClient(host=host, port=port, password=password)
+        events.callback.register(on_record_state_changed)
+
         # Get OBS version
         version = client.get_version()
         logger.info(f"OBS Version: {version.obs_version}, WebSocket: {version.obs_web_socket_version}")
@@ -79,8 +94,11 @@ def test_obs_recording():
             logger.error(f"Failed to stop recording: {e}")
             output_path = None
         
-        # Check if recording was actually saved
+        # Check if recording was actually saved, once OBS reports the
+        # record output fully stopped
         if output_path:
+            if not record_stopped.wait(timeout=10):
+                logger.warning("Timed out waiting for record-stopped event")
             path_obj = Path(output_path)
             if path_obj.exists():
                 logger.info(f"Recording file exists: {output_path}")